@@ -24,3 +24,7 @@ pyinstaller \
   "$INSTALLER_DIR/web.py"
 
 echo "Built: $OUT_DIR/agent-skills-server/"
+
+# Pack skills into one indexed archive the server reads via mmap (SKILLS_BUNDLE)
+python3 "$INSTALLER_DIR/web.py" --build-bundle "$OUT_DIR/skills.bundle" "$REPO_DIR/skills" >/dev/null
+echo "Built: $OUT_DIR/skills.bundle"
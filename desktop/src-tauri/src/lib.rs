@@ -1,6 +1,7 @@
+use std::io::{BufRead, BufReader};
 use std::net::TcpListener;
-use std::process::{Child, Command};
-use std::sync::Mutex;
+use std::process::{Child, Command, Stdio};
+use std::sync::{mpsc, Mutex};
 use std::time::{Duration, Instant};
 
 use tauri::Manager;
@@ -13,16 +14,25 @@ fn find_available_port() -> u16 {
     port
 }
 
-fn wait_for_server(port: u16, timeout: Duration) -> bool {
-    let start = Instant::now();
-    while start.elapsed() < timeout {
-        if TcpListener::bind(("127.0.0.1", port)).is_err() {
-            // Port is in use — server is up
-            return true;
+/// Wait for the server's "READY <url>" line on stdout and return the url.
+/// The server prints it once its socket is listening, possibly on another
+/// port if the requested one was taken. Stdout keeps being drained afterwards.
+fn wait_for_ready(child: &mut Child, timeout: Duration) -> Option<String> {
+    let stdout = child.stdout.take()?;
+    let (tx, rx) = mpsc::channel();
+    std::thread::spawn(move || {
+        let mut announced = false;
+        for line in BufReader::new(stdout).lines() {
+            let Ok(line) = line else { break };
+            if !announced {
+                if let Some(url) = line.strip_prefix("READY ") {
+                    let _ = tx.send(url.trim().to_string());
+                    announced = true;
+                }
+            }
         }
-        std::thread::sleep(Duration::from_millis(100));
-    }
-    false
+    });
+    rx.recv_timeout(timeout).ok()
 }
 
 struct ServerProcess(Mutex<Option<Child>>);
@@ -44,24 +54,31 @@ pub fn run() {
         .setup(move |app| {
             let resource_path = app.path().resource_dir()?;
             let server_bin = resource_path.join("agent-skills-server/agent-skills-server");
-            let skills_dir = resource_path.join("skills");
+            let skills_bundle = resource_path.join("skills.bundle");
 
-            let child = Command::new(&server_bin)
+            let started = Instant::now();
+            let mut child = Command::new(&server_bin)
                 .arg("--no-browser")
                 .arg(port.to_string())
-                .env("SKILLS_DIR", &skills_dir)
+                .env("SKILLS_BUNDLE", &skills_bundle)
                 .env("BUNDLED_MODE", "1")
+                .stdout(Stdio::piped())
                 .spawn()
                 .expect("Failed to start agent-skills-server");
 
+            let ready_url = wait_for_ready(&mut child, Duration::from_secs(10));
             app.manage(ServerProcess(Mutex::new(Some(child))));
 
-            let server_ready = wait_for_server(port, Duration::from_secs(10));
-            if !server_ready {
-                eprintln!("Warning: web.py did not start within 10 seconds");
-            }
-
-            let url = format!("http://localhost:{}", port);
+            let url = match ready_url {
+                Some(url) => {
+                    eprintln!("web.py ready in {} ms", started.elapsed().as_millis());
+                    url
+                }
+                None => {
+                    eprintln!("Warning: web.py did not start within 10 seconds");
+                    format!("http://localhost:{}", port)
+                }
+            };
             let main_window = app.get_webview_window("main").unwrap();
             main_window.navigate(url.parse().unwrap())?;
 
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Agent Skills Installer - Benchmarks
+Measures web.py against a synthetic skills repo and many providers.
+Uses only Python stdlib, no external dependencies.
+
+    python3 installer/bench.py --output bench.json
+    python3 installer/bench.py --baseline bench.json --threshold 0.25
+
+Each run builds a fresh workspace (SKILLS_DIR, HOME and INSTALLER_DIR
+overrides) and imports web.py in a child process, so nothing touches the
+real ~/.agent-skills or provider directories.
+"""
+
+import argparse
+import http.client
+import importlib.util
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+WEB_PY = SCRIPT_DIR / "web.py"
+
+DEFAULT_SKILLS = 300
+DEFAULT_PROVIDERS = 20
+DEFAULT_ITERATIONS = 10
+DEFAULT_CONCURRENCY = 8
+DEFAULT_THRESHOLD = 0.25
+# Medians closer than this are never reported as regressions
+MIN_REGRESSION_DELTA = 0.002
+SEED = 1234
+
+
+def generate_workspace(root, skill_count, provider_count, seed=SEED):
+    """Create a synthetic skills repo, HOME and provider config under root."""
+    rng = random.Random(seed)
+    skills_dir = root / "skills"
+    home = root / "home"
+    skills_dir.mkdir(parents=True)
+
+    for index in range(skill_count):
+        skill_id = f"bench-skill-{index:04d}"
+        skill_dir = skills_dir / skill_id
+        skill_dir.mkdir()
+        files = {
+            skill_id: rng.randint(2, 20) * 1024,
+            "SKILL.md": rng.randint(1, 8) * 1024,
+            "README.md": rng.randint(1, 4) * 1024,
+        }
+        # Every tenth skill ships a larger asset
+        if index % 10 == 0:
+            files["data.bin"] = rng.randint(64, 2048) * 1024
+        for name, size in files.items():
+            (skill_dir / name).write_bytes(rng.randbytes(size))
+        os.chmod(skill_dir / skill_id, 0o755)
+
+        skill_upper = skill_id.upper().replace("-", "_")
+        skill_json = {
+            "name": skill_id,
+            "title": f"Bench skill {index}",
+            "description": "Synthetic skill generated by installer/bench.py",
+            "version": "1.0.0",
+            "fields": [
+                {"name": "api_key", "label": "API key", "type": "password", "env_var": f"{skill_upper}_API_KEY"},
+                {
+                    "name": "organizations",
+                    "label": "Organizations",
+                    "type": "list",
+                    "item_fields": [
+                        {"name": "slug", "type": "text", "required": True},
+                        {"name": "token", "type": "password", "required": True},
+                        {"name": "url", "type": "text", "default": "https://example.com"},
+                    ],
+                },
+            ],
+            "test_command": "test",
+            "files": sorted(files),
+        }
+        if index % 4 == 0:
+            skill_json["dependencies"] = [
+                {"name": "sh", "check": "command -v sh", "install": {"macos": "true", "linux": "true"}},
+            ]
+        (skill_dir / "skill.json").write_text(json.dumps(skill_json, indent=2))
+
+    providers = {
+        f"bench-{index:02d}": {
+            "enabled": True,
+            "path": str(home / "providers" / f"bench-{index:02d}" / "skills"),
+            "name": f"Bench {index}",
+            "custom": True,
+        }
+        for index in range(provider_count)
+    }
+    config_dir = home / ".agent-skills"
+    config_dir.mkdir(parents=True)
+    config = {"providers": providers, "selected_provider": next(iter(providers), "claude")}
+    (config_dir / "config.json").write_text(json.dumps(config, indent=2))
+    return skills_dir, home
+
+
+def summarize(durations, ops=1):
+    """Return latency stats (seconds) and throughput for a list of run durations."""
+    ordered = sorted(durations)
+    median = statistics.median(ordered)
+    return {
+        "runs": len(ordered),
+        "ops": ops,
+        "min": round(ordered[0], 6),
+        "median": round(median, 6),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 6),
+        "max": round(ordered[-1], 6),
+        "ops_per_sec": round(ops / median, 2) if median > 0 else None,
+    }
+
+
+def timed(func, iterations, setup=None):
+    durations = []
+    for _ in range(iterations):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+def load_web():
+    spec = importlib.util.spec_from_file_location("web", WEB_PY)
+    web = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(web)
+    return web
+
+
+def http_get(conn, path):
+    conn.request("GET", path)
+    response = conn.getresponse()
+    body = response.read()
+    if response.status != 200:
+        raise RuntimeError(f"GET {path} returned {response.status}")
+    return body
+
+
+def run_benchmarks(iterations, concurrency):
+    """Run every benchmark in this process. Expects the workspace env to be set."""
+    results = {}
+    started = time.perf_counter()
+    web = load_web()
+    results["import"] = summarize([time.perf_counter() - started])
+
+    results["get_skills_cold"] = summarize(timed(web.get_skills, 1), len(web.SKILL_CATALOG.ids()))
+
+    skills = web.SKILL_CATALOG.all()
+    providers = web.get_enabled_providers()
+    installs = len(skills) * len(providers)
+
+    results["get_skills"] = summarize(timed(web.get_skills, iterations), len(skills))
+
+    def install_all():
+        for skill in skills:
+            web.install_files(skill["id"], skill)
+
+    results["install_files_cold"] = summarize(timed(install_all, 1), installs)
+    results["install_files_noop"] = summarize(timed(install_all, max(1, iterations // 2)), installs)
+    results["get_skills_installed"] = summarize(timed(web.get_skills, iterations), len(skills))
+
+    results["update_installed_skills_noop"] = summarize(
+        timed(web.update_installed_skills, iterations), installs
+    )
+
+    touched = skills[::10]
+
+    def touch_skills():
+        for skill in touched:
+            path = web.SKILLS_DIR / skill["id"] / "SKILL.md"
+            path.write_bytes(os.urandom(path.stat().st_size))
+
+    results["update_installed_skills_changed"] = summarize(
+        timed(web.update_installed_skills, max(1, iterations // 2), setup=touch_skills),
+        len(touched) * len(providers),
+    )
+
+    configured = skills[:50]
+    for index, skill in enumerate(configured):
+        web.save_skill_config(skill["id"], skill, {
+            "api_key": f"key-{index}",
+            "organizations": [
+                {"slug": f"org-{n}", "token": f"token-{index}-{n}", "url": "https://example.com"}
+                for n in range(5)
+            ],
+        })
+
+    def read_configs():
+        for skill in configured:
+            web.get_current_config(skill["id"], skill)
+
+    results["get_current_config"] = summarize(timed(read_configs, iterations), len(configured))
+
+    server = web.InstallerServer(("localhost", 0), web.RequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    try:
+        conn = http.client.HTTPConnection("localhost", port)
+        results["http_api_skills"] = summarize(
+            timed(lambda: http_get(conn, "/api/skills"), iterations), 1
+        )
+        conn.close()
+
+        per_client = max(1, iterations // 2)
+
+        def client():
+            conn = http.client.HTTPConnection("localhost", port)
+            for _ in range(per_client):
+                http_get(conn, "/api/skills")
+            conn.close()
+
+        def burst():
+            threads = [threading.Thread(target=client) for _ in range(concurrency)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        results["http_api_skills_concurrent"] = summarize(
+            timed(burst, 3), concurrency * per_client
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    return results
+
+
+def measure_startup(env, runs):
+    """Time server start to the READY line and to the first page and /api/skills.
+
+    This is the path the desktop app takes before its first paint.
+    """
+    ready, first_page = [], []
+    for _ in range(runs):
+        started = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, str(WEB_PY), "--no-browser", "0"],
+            env=env, stdout=subprocess.PIPE, text=True,
+        )
+        try:
+            url = None
+            for line in proc.stdout:
+                if line.startswith("READY "):
+                    url = line.split(None, 1)[1].strip()
+                    break
+            if url is None:
+                raise SystemExit("Server exited before announcing READY")
+            ready.append(time.perf_counter() - started)
+
+            host, port = url.removeprefix("http://").split(":")
+            conn = http.client.HTTPConnection(host, int(port))
+            http_get(conn, "/")
+            http_get(conn, "/api/providers")
+            http_get(conn, "/api/skills")
+            first_page.append(time.perf_counter() - started)
+            conn.close()
+        finally:
+            proc.terminate()
+            proc.wait()
+    return {
+        "startup_ready": summarize(ready),
+        "startup_first_page": summarize(first_page),
+    }
+
+
+def run_in_workspace(args):
+    """Build a workspace and run the benchmarks in a child process."""
+    root = Path(tempfile.mkdtemp(prefix="agent-skills-bench-"))
+    try:
+        skills_dir, home = generate_workspace(root, args.skills, args.providers)
+        env = dict(
+            os.environ,
+            SKILLS_DIR=str(skills_dir),
+            HOME=str(home),
+            INSTALLER_DIR=str(SCRIPT_DIR),
+            BUNDLED_MODE="1",
+        )
+        result = subprocess.run(
+            [sys.executable, __file__, "--worker",
+             "--iterations", str(args.iterations), "--concurrency", str(args.concurrency)],
+            env=env, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            sys.stderr.write(result.stderr)
+            raise SystemExit(f"Benchmark worker failed with exit code {result.returncode}")
+        benchmarks = json.loads(result.stdout)
+        benchmarks.update(measure_startup(env, max(3, args.iterations // 2)))
+        return benchmarks
+    finally:
+        if args.keep:
+            print(f"Workspace kept at {root}", file=sys.stderr)
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+def git_commit():
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], cwd=SCRIPT_DIR, capture_output=True, text=True
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def compare(results, baseline, threshold):
+    """Return (name, old median, new median) for benchmarks slower than threshold."""
+    regressions = []
+    for name, current in results["benchmarks"].items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if not previous:
+            continue
+        old, new = previous["median"], current["median"]
+        if new - old > MIN_REGRESSION_DELTA and new > old * (1 + threshold):
+            regressions.append((name, old, new))
+    return regressions
+
+
+def print_table(results, baseline=None):
+    rows = [("benchmark", "median ms", "p95 ms", "ops/s", "baseline ms", "change")]
+    for name, stats in results["benchmarks"].items():
+        previous = (baseline or {}).get("benchmarks", {}).get(name)
+        change = ""
+        old = ""
+        if previous and previous["median"]:
+            old = f"{previous['median'] * 1000:.2f}"
+            change = f"{(stats['median'] / previous['median'] - 1) * 100:+.1f}%"
+        rows.append((
+            name,
+            f"{stats['median'] * 1000:.2f}",
+            f"{stats['p95'] * 1000:.2f}",
+            str(stats["ops_per_sec"] or ""),
+            old,
+            change,
+        ))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    for row in rows:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)), file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the installer backend.")
+    parser.add_argument("--skills", type=int, default=DEFAULT_SKILLS, help="synthetic skills to generate")
+    parser.add_argument("--providers", type=int, default=DEFAULT_PROVIDERS, help="custom providers to enable")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="runs per benchmark")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="parallel HTTP clients")
+    parser.add_argument("--output", help="write results JSON to this file")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed median slowdown before failing (0.25 = 25%%)")
+    parser.add_argument("--keep", action="store_true", help="keep the generated workspace")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        json.dump(run_benchmarks(args.iterations, args.concurrency), sys.stdout)
+        return
+
+    results = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "skills": args.skills,
+            "providers": args.providers,
+            "iterations": args.iterations,
+            "concurrency": args.concurrency,
+        },
+        "benchmarks": run_in_workspace(args),
+    }
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_table(results, baseline)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+    else:
+        print(json.dumps(results, indent=2))
+
+    if baseline:
+        regressions = compare(results, baseline, args.threshold)
+        for name, old, new in regressions:
+            print(f"REGRESSION {name}: {old * 1000:.2f} ms -> {new * 1000:.2f} ms", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,8 @@ GUM_VERSION="0.14.5"
 CONFIG_DIR="$HOME/.agent-skills"
 CONFIG_FILE="$CONFIG_DIR/config.json"
 PROVIDERS_FILE="$SCRIPT_DIR/providers.json"
+# Status, checksum and file sync logic lives in web.py (run headless)
+WEB_PY="$SCRIPT_DIR/web.py"
 
 # Load default providers from providers.json
 load_default_providers() {
@@ -768,30 +770,45 @@ get_skills() {
     done
 }
 
-# Compute checksum of skill files in repo
-compute_skill_checksum() {
-    local skill="$1"
-    local skill_dir="$SKILLS_DIR/$skill"
-    local skill_json="$skill_dir/skill.json"
-
-    python3 -c "
-import hashlib
-import json
-from pathlib import Path
+# Print skill statuses from web.py --status-json, one process per screen.
+# Args: optional skill ids (default: all skills). Output lines:
+#   skill|<id>|<title>|<needs_config>|<has_test>|<has_deps>|<version>|<description>
+#   provider|<skill id>|<provider id>|<status>|<name>|<path>
+skill_status_lines() {
+    python3 "$WEB_PY" --status-json "$@" | python3 -c "
+import json, sys
+
+report = json.load(sys.stdin)
+names = {p['id']: p['name'] for p in report['providers']}
+flag = lambda value: '1' if value else ''
+for s in report['skills']:
+    print('|'.join(['skill', s['id'], s['title'], flag(s['needs_config']), flag(s['has_test']),
+                    flag(s['has_dependencies']), s['version'], ' '.join(s['description'].split())]))
+    for pid, info in s['providers'].items():
+        print('|'.join(['provider', s['id'], pid, info['status'], names[pid], info['path']]))
+"
+}
 
-skill_dir = Path('$skill_dir')
-with open('$skill_json') as f:
-    data = json.load(f)
+# Load one skill's info and per-provider status into SKILL_* and PROVIDER_* globals
+load_skill_status() {
+    local skill="$1"
+    local kind f1 f2 f3 f4 f5 rest
 
-hasher = hashlib.sha256()
-for file_spec in sorted(data.get('files', [])):
-    src = file_spec.split(':')[0] if ':' in file_spec else file_spec
-    src_path = skill_dir / src
-    if src_path.exists():
-        hasher.update(src_path.read_bytes())
+    SKILL_TITLE="" SKILL_NEEDS_CONFIG="" SKILL_HAS_TEST="" SKILL_HAS_DEPS=""
+    SKILL_VERSION="" SKILL_DESCRIPTION=""
+    PROVIDER_IDS=() PROVIDER_STATUSES=() PROVIDER_NAMES=() PROVIDER_PATHS=()
 
-print(hasher.hexdigest()[:16])
-"
+    while IFS='|' read -r kind f1 f2 f3 f4 f5 rest; do
+        case "$kind" in
+            skill)
+                SKILL_TITLE="$f2" SKILL_NEEDS_CONFIG="$f3" SKILL_HAS_TEST="$f4" SKILL_HAS_DEPS="$f5"
+                SKILL_VERSION="${rest%%|*}" SKILL_DESCRIPTION="${rest#*|}"
+                ;;
+            provider)
+                PROVIDER_IDS+=("$f2") PROVIDER_STATUSES+=("$f3") PROVIDER_NAMES+=("$f4") PROVIDER_PATHS+=("$f5")
+                ;;
+        esac
+    done < <(skill_status_lines "$skill")
 }
 
 # Read skill.json field using Python (cross-platform)
@@ -844,40 +861,15 @@ get_skill_status_for_provider() {
 
     [[ -z "$provider" ]] && echo "not_installed" && return
 
-    local install_path
-    install_path=$(get_install_path "$skill" "$provider")
-
-    if [[ ! -d "$install_path" ]]; then
-        echo "not_installed"
-        return
-    fi
-
-    local repo_checksum
-    repo_checksum=$(compute_skill_checksum "$skill")
-
-    # Check if outdated
-    if [[ ! -f "$install_path/.checksum" ]]; then
-        echo "outdated"
-        return
-    fi
-
-    local installed_checksum
-    installed_checksum=$(cat "$install_path/.checksum")
-    if [[ "$installed_checksum" != "$repo_checksum" ]]; then
-        echo "outdated"
-        return
-    fi
-
-    # Check if configured (has credentials)
-    if skill_needs_config "$skill"; then
-        if [[ -f "$install_path/.env" ]]; then
-            echo "configured"
-        else
-            echo "installed"
+    load_skill_status "$skill"
+    local i
+    for i in "${!PROVIDER_IDS[@]}"; do
+        if [[ "${PROVIDER_IDS[$i]}" == "$provider" ]]; then
+            echo "${PROVIDER_STATUSES[$i]}"
+            return
         fi
-    else
-        echo "configured"
-    fi
+    done
+    echo "not_installed"
 }
 
 # Get skill status for the selected provider (legacy, uses first enabled)
@@ -888,42 +880,34 @@ get_skill_status() {
     get_skill_status_for_provider "$skill" "$provider"
 }
 
-# Show skill info
+# Show skill info (also loads SKILL_* / PROVIDER_* for get_actions)
 show_skill_info() {
     local skill="$1"
-    local skill_json="$SKILLS_DIR/$skill/skill.json"
 
-    local title description version
-    title=$(read_json "$skill_json" "title")
-    description=$(read_json "$skill_json" "description")
-    version=$(read_json "$skill_json" "version")
+    load_skill_status "$skill"
 
-    header "$title"
+    header "$SKILL_TITLE"
 
-    echo -e "${DIM}$description${NC}"
+    echo -e "${DIM}$SKILL_DESCRIPTION${NC}"
     echo ""
-    echo -e "Version: ${BOLD}$version${NC}"
+    echo -e "Version: ${BOLD}$SKILL_VERSION${NC}"
     echo ""
 
     # Show status for each enabled provider
     echo "Installation:"
-    while IFS= read -r provider; do
-        local pname pstatus path
-        pname=$(get_provider_name "$provider")
-        pstatus=$(get_skill_status_for_provider "$skill" "$provider")
-        path=$(get_install_path "$skill" "$provider")
-
+    local i
+    for i in "${!PROVIDER_IDS[@]}"; do
         local status_color status_text
-        case "$pstatus" in
+        case "${PROVIDER_STATUSES[$i]}" in
             not_installed) status_color="$YELLOW"; status_text="not installed" ;;
             installed) status_color="$CYAN"; status_text="needs config" ;;
             configured) status_color="$GREEN"; status_text="ready" ;;
             outdated) status_color="$YELLOW"; status_text="update available" ;;
         esac
 
-        echo -e "  ${CYAN}$pname${NC}: ${status_color}$status_text${NC}"
-        echo -e "    ${DIM}$path${NC}"
-    done < <(get_enabled_providers)
+        echo -e "  ${CYAN}${PROVIDER_NAMES[$i]}${NC}: ${status_color}$status_text${NC}"
+        echo -e "    ${DIM}${PROVIDER_PATHS[$i]}${NC}"
+    done
     echo ""
 }
 
@@ -935,30 +919,27 @@ skill_has_test() {
     [[ -n "$test_cmd" ]]
 }
 
-# Get available actions for a skill (per provider)
+# Get available actions for a skill (per provider), from show_skill_info's status
 get_actions() {
     local skill="$1"
 
     # Add per-provider actions
-    while IFS= read -r provider; do
-        [[ -z "$provider" ]] && continue
-        local pname pstatus
-        pname=$(get_provider_name "$provider")
-        pstatus=$(get_skill_status_for_provider "$skill" "$provider")
-
-        case "$pstatus" in
+    local i
+    for i in "${!PROVIDER_IDS[@]}"; do
+        local pname="${PROVIDER_NAMES[$i]}"
+        case "${PROVIDER_STATUSES[$i]}" in
             not_installed) echo "Install in $pname" ;;
             outdated) echo "Update in $pname" ;;
             *) echo "Remove from $pname" ;;
         esac
-    done < <(get_enabled_providers)
+    done
 
     echo "─────────────"
 
     # Global actions
-    skill_has_test "$skill" && echo "Test"
-    skill_needs_config "$skill" && echo "Edit credentials"
-    skill_has_dependencies "$skill" && echo "Check dependencies"
+    [[ -n "$SKILL_HAS_TEST" ]] && echo "Test"
+    [[ -n "$SKILL_NEEDS_CONFIG" ]] && echo "Edit credentials"
+    [[ -n "$SKILL_HAS_DEPS" ]] && echo "Check dependencies"
     echo "Back"
 }
 
@@ -970,45 +951,12 @@ skill_has_dependencies() {
     [[ "$deps_count" -gt 0 ]]
 }
 
-# Install skill files to a single provider
+# Install skill files to a single provider (copies files and central .env, updates the manifest)
 install_files_to_provider() {
     local skill="$1"
     local provider="$2"
-    local skill_dir="$SKILLS_DIR/$skill"
-    local skill_json="$skill_dir/skill.json"
-    local install_path
-    install_path=$(get_install_path "$skill" "$provider")
-
-    mkdir -p "$install_path"
-
-    # Read files list and copy
-    while IFS= read -r file_spec; do
-        [[ -z "$file_spec" ]] && continue
 
-        local src dst
-        if [[ "$file_spec" == *":"* ]]; then
-            src="${file_spec%%:*}"
-            dst="${file_spec##*:}"
-        else
-            src="$file_spec"
-            dst="$(basename "$file_spec")"
-        fi
-
-        if [[ -f "$skill_dir/$src" ]]; then
-            cp "$skill_dir/$src" "$install_path/$dst"
-            chmod +x "$install_path/$dst" 2>/dev/null || true
-        fi
-    done < <(read_json "$skill_json" "files")
-
-    # Save checksum
-    compute_skill_checksum "$skill" > "$install_path/.checksum"
-
-    # Copy central .env if exists
-    local central_env="$CONFIG_DIR/$skill/.env"
-    if [[ -f "$central_env" ]]; then
-        cp "$central_env" "$install_path/.env"
-        chmod 600 "$install_path/.env"
-    fi
+    python3 "$WEB_PY" --install-files "$skill" "$provider" >/dev/null
 }
 
 # Install skill files to all enabled providers
@@ -1023,32 +971,16 @@ install_files() {
     done < <(get_enabled_providers)
 }
 
-# Update installed skills whose repo files changed
+# Update installed skills whose repo files changed; prints the number updated
 update_installed_skills() {
-    local updated=0
-
-    for dir in "$SKILLS_DIR"/*/; do
-        [[ -f "$dir/skill.json" ]] || continue
-
-        local skill
-        skill=$(basename "$dir")
-
-        while IFS= read -r provider; do
-            [[ -z "$provider" ]] && continue
-
-            local install_path status
-            install_path=$(get_install_path "$skill" "$provider")
-            [[ -d "$install_path" ]] || continue
-
-            status=$(get_skill_status_for_provider "$skill" "$provider")
-            if [[ "$status" == "outdated" ]]; then
-                install_files_to_provider "$skill" "$provider" >/dev/null
-                updated=$((updated + 1))
-            fi
-        done < <(get_enabled_providers)
-    done
+    local result
+    result=$(python3 "$WEB_PY" --update-installed)
 
-    echo "$updated"
+    if [[ "$result" =~ \"updated\":\ ([0-9]+) ]]; then
+        echo "${BASH_REMATCH[1]}"
+    else
+        echo "0"
+    fi
 }
 
 # Configure skill credentials
@@ -1195,14 +1127,7 @@ if lines:
     fi
 
     # Sync to all installed providers
-    while IFS= read -r provider; do
-        [[ -z "$provider" ]] && continue
-        local install_path
-        install_path=$(get_install_path "$skill" "$provider")
-        [[ -d "$install_path" ]] || continue
-        cp "$central_dir/.env" "$install_path/.env"
-        chmod 600 "$install_path/.env"
-    done < <(get_enabled_providers)
+    python3 "$WEB_PY" --sync-config "$skill" >/dev/null
 
     style green "Configuration saved"
 }
@@ -1652,10 +1577,8 @@ test_skill() {
 uninstall_from_provider() {
     local skill="$1"
     local provider="$2"
-    local install_path
-    install_path=$(get_install_path "$skill" "$provider")
 
-    [[ -d "$install_path" ]] && rm -rf "$install_path"
+    python3 "$WEB_PY" --uninstall "$skill" "$provider" >/dev/null
 }
 
 # Uninstall skill from all providers
@@ -1670,7 +1593,7 @@ uninstall_skill() {
         install_path=$(get_install_path "$skill" "$provider")
 
         if [[ -d "$install_path" ]]; then
-            rm -rf "$install_path"
+            uninstall_from_provider "$skill" "$provider"
             echo -e "  Removed from ${CYAN}$name${NC}"
             any_uninstalled=true
         fi
@@ -1741,70 +1664,28 @@ main_menu() {
     while true; do
         header "Agent Skills Installer"
 
-        # Get all skills info in a single python call
+        # Get all skills info in a single web.py call
         local skills=()
         local skill_options=()
-        local all_skills_info
-        all_skills_info=$(python3 -c "
-import json, hashlib
-from pathlib import Path
-
-skills_dir = Path('$SKILLS_DIR')
-config_file = Path.home() / '.agent-skills' / 'config.json'
-providers_file = Path('$PROVIDERS_FILE')
-
-# Load default provider names
-default_provider_names = {}
-if providers_file.exists():
-    with open(providers_file) as f:
-        for p in json.load(f):
-            default_provider_names[p['id']] = p['name'].split()[0]  # First word (e.g., 'Claude' from 'Claude Code')
-
-with open(config_file) as f:
-    config = json.load(f)
-
-providers = [(p, info.get('path', ''), info.get('name', '')) for p, info in config.get('providers', {}).items() if info.get('enabled')]
-
-for skill_dir in sorted(skills_dir.iterdir()):
-    skill_json = skill_dir / 'skill.json'
-    if not skill_json.exists():
-        continue
-
-    with open(skill_json) as f:
-        data = json.load(f)
-
-    title = data.get('title', skill_dir.name)
-    skill_id = skill_dir.name
-
-    # Compute repo checksum
-    hasher = hashlib.sha256()
-    for file_spec in sorted(data.get('files', [])):
-        src = file_spec.split(':')[0] if ':' in file_spec else file_spec
-        src_path = skill_dir / src
-        if src_path.exists():
-            hasher.update(src_path.read_bytes())
-    repo_checksum = hasher.hexdigest()[:16]
-
-    # Check status for each provider
-    badges = ''
-    for p, base_path, config_name in providers:
-        # Get short name: from config, from defaults, or use ID
-        name = config_name.split()[0] if config_name else default_provider_names.get(p, p)
-        install_path = Path(base_path) / skill_id if base_path else None
-
-        if not install_path or not install_path.is_dir():
-            badges += f'[· {name}] '
-            continue
-
-        checksum_file = install_path / '.checksum'
-        if not checksum_file.exists() or checksum_file.read_text().strip() != repo_checksum:
-            badges += f'[↑ {name}] '
-            continue
-
-        badges += f'[✓ {name}] '
-
-    print(f'{skill_id}|{title}|{badges.strip()}')
-")
+        local all_skills_info=""
+        local kind f1 f2 f3 f4 f5 rest current="" current_title="" badges=""
+        while IFS='|' read -r kind f1 f2 f3 f4 f5 rest; do
+            case "$kind" in
+                skill)
+                    [[ -n "$current" ]] && all_skills_info+="$current|$current_title|${badges% }"$'\n'
+                    current="$f1" current_title="$f2" badges=""
+                    ;;
+                provider)
+                    # Short name, e.g. 'Claude' from 'Claude Code'
+                    case "$f3" in
+                        not_installed) badges+="[· ${f4%% *}] " ;;
+                        outdated) badges+="[↑ ${f4%% *}] " ;;
+                        *) badges+="[✓ ${f4%% *}] " ;;
+                    esac
+                    ;;
+            esac
+        done < <(skill_status_lines)
+        [[ -n "$current" ]] && all_skills_info+="$current|$current_title|${badges% }"
 
         local titles=()
         while IFS='|' read -r skill_id title badges; do
@@ -4,20 +4,37 @@ Agent Skills Installer - Web Server
 Uses only Python stdlib, no external dependencies.
 """
 
-import hashlib
+import contextlib
+import copy
+import functools
+import gzip
 import http.server
 import json
 import os
-import subprocess
+import queue
+import shutil
+import signal
+import struct
 import sys
+import threading
+import time
 import urllib.parse
-import webbrowser
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# concurrent.futures, hashlib, subprocess and webbrowser are imported where
+# they are used, so the server can start listening sooner.
+
 _FROZEN = getattr(sys, '_MEIPASS', None)
 SCRIPT_DIR = Path(_FROZEN) if _FROZEN else Path(__file__).parent.resolve()
 _installer_dir = Path(os.environ["INSTALLER_DIR"]) if "INSTALLER_DIR" in os.environ else SCRIPT_DIR
 SKILLS_DIR = Path(os.environ["SKILLS_DIR"]) if "SKILLS_DIR" in os.environ else SCRIPT_DIR.parent / "skills"
+# Packed skills (build_skill_bundle); when set, used instead of SKILLS_DIR
+SKILLS_BUNDLE_FILE = Path(os.environ["SKILLS_BUNDLE"]) if os.environ.get("SKILLS_BUNDLE") else None
 TEMPLATES_DIR = _installer_dir / "templates"
 PROVIDERS_FILE = _installer_dir / "providers.json"
 
@@ -26,13 +43,378 @@ BUNDLED_MODE = os.environ.get("BUNDLED_MODE") == "1"
 # Provider configuration
 CONFIG_DIR = Path.home() / ".agent-skills"
 CONFIG_FILE = CONFIG_DIR / "config.json"
+CHECKSUM_CACHE_FILE = CONFIG_DIR / "checksums.json"
+CHECKSUM_CACHE_VERSION = 1
+BUNDLE_MAGIC = b"ASKB"
+BUNDLE_VERSION = 2
+BUNDLE_HEADER = struct.Struct("<4sIQQ")  # magic, version, index offset, index length
+MANIFEST_NAME = ".agent-skills-manifest.json"
+MANIFEST_VERSION = 1
+
+# Install modes: "copy" puts a full copy of each file in every provider,
+# "link" keeps one copy per content hash in STORE_DIR and links to it
+INSTALL_MODES = ("copy", "link")
+STORE_DIR = CONFIG_DIR / "store"
+HASH_CHUNK_SIZE = 1024 * 1024
+CHECKSUM_SAVE_DELAY = 1.0
+
+# Background jobs
+JOB_WORKERS = 4
+JOB_HISTORY_LIMIT = 50
+
+# Server-Sent Events
+EVENT_QUEUE_SIZE = 256
+EVENT_KEEPALIVE_SECONDS = 15
+EVENT_COALESCE_DELAY = 0.05
+
+
+def _env_seconds(name, default):
+    """Read a positive number of seconds from the environment, else default."""
+    try:
+        value = int(os.environ.get(name, default))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+# Background update checks
+UPDATE_CHECK_INTERVAL = _env_seconds("UPDATE_CHECK_INTERVAL", 900)
+UPDATE_CHECK_BACKOFF = 60
+UPDATE_CHECK_MAX_BACKOFF = 3600
+GIT_FETCH_TIMEOUT = 60
+
+# Install fan-out
+INSTALL_WORKERS = 4
+
+# Dependency checks
+DEPENDENCY_CHECK_TTL = 300
+DEPENDENCY_CHECK_TIMEOUT = 10
+DEPENDENCY_CHECK_WORKERS = 8
+
+# Skill tests
+TEST_TIMEOUT = 60
+TEST_WORKERS = 4
+TEST_RESULTS_FILE = CONFIG_DIR / "test-results.json"
+TEST_OUTPUT_LIMIT = 16 * 1024
+
+# HTTP responses
+GZIP_MIN_SIZE = 1024
+KEEPALIVE_TIMEOUT = 30
+
+# Metrics (/api/metrics) and opt-in request profiling (?profile=1 or X-Profile: 1)
+METRICS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+PROFILE_HISTORY_LIMIT = 10
+PROFILE_STAT_LINES = 40
+
+# Serializes writes to config.json, central .env files and provider installs
+_write_lock = threading.RLock()
+# Serializes writes under one provider root; taken after _write_lock, never before
+_provider_locks = {}
+_provider_locks_guard = threading.Lock()
+# Held by link-mode installs from storing a file until their manifest is
+# committed, and by prune_store while it reads manifests and deletes;
+# taken before provider locks, never after
+_store_lock = threading.RLock()
+
+
+def serialized(func):
+    """Run func while holding the installer-wide write lock."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _write_lock:
+            return func(*args, **kwargs)
+    return wrapper
+
+
+class LazyThreadPool:
+    """ThreadPoolExecutor that is only created (and imported) on first submit."""
+
+    def __init__(self, max_workers, thread_name_prefix):
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        with self._lock:
+            if self._executor is None:
+                import concurrent.futures
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix=self._thread_name_prefix
+                )
+        return self._executor.submit(fn, *args, **kwargs)
+
+
+def provider_lock(provider_id):
+    """Return the lock that serializes writes under a provider's install root."""
+    root = get_provider_path(provider_id)
+    with _provider_locks_guard:
+        return _provider_locks.setdefault(root, threading.RLock())
+
+
+class Metrics:
+    """In-process counters for request latency, subprocesses and file I/O.
+
+    Route latencies go into fixed histogram buckets (METRICS_BUCKETS,
+    seconds). Everything is kept in memory and exposed at /api/metrics.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = time.time()
+        self._routes = {}
+        self._processes = {}
+        self._files = {"reads": 0, "read_bytes": 0, "writes": 0, "write_bytes": 0, "scans": 0}
+        self._profiles = {}
+
+    def record_request(self, route, status, seconds):
+        with self._lock:
+            entry = self._routes.get(route)
+            if entry is None:
+                entry = self._routes[route] = {
+                    "count": 0, "errors": 0, "total": 0.0, "max": 0.0,
+                    "buckets": [0] * (len(METRICS_BUCKETS) + 1),
+                }
+            entry["count"] += 1
+            entry["total"] += seconds
+            entry["max"] = max(entry["max"], seconds)
+            if status >= 400:
+                entry["errors"] += 1
+            index = next((i for i, bound in enumerate(METRICS_BUCKETS) if seconds <= bound), len(METRICS_BUCKETS))
+            entry["buckets"][index] += 1
+
+    @contextlib.contextmanager
+    def time_process(self, kind):
+        """Count one subprocess run of the given kind and its wall time."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            with self._lock:
+                entry = self._processes.setdefault(kind, {"count": 0, "total": 0.0, "max": 0.0})
+                entry["count"] += 1
+                entry["total"] += seconds
+                entry["max"] = max(entry["max"], seconds)
+
+    def count_read(self, nbytes=0):
+        with self._lock:
+            self._files["reads"] += 1
+            self._files["read_bytes"] += nbytes
+
+    def count_write(self, nbytes=0):
+        with self._lock:
+            self._files["writes"] += 1
+            self._files["write_bytes"] += nbytes
+
+    def count_scan(self):
+        with self._lock:
+            self._files["scans"] += 1
+
+    def begin_profile(self, profile_id):
+        """Reserve a profile id; readers wait for it until finish_profile."""
+        with self._lock:
+            self._profiles[profile_id] = {"id": profile_id, "done": threading.Event()}
+            while len(self._profiles) > PROFILE_HISTORY_LIMIT:
+                del self._profiles[next(iter(self._profiles))]
+
+    def finish_profile(self, profile_id, route, seconds, summary):
+        with self._lock:
+            profile = self._profiles.get(profile_id)
+            if profile is None:
+                return
+            profile.update(route=route, seconds=seconds, summary=summary)
+        profile["done"].set()
+
+    def get_profile(self, profile_id, timeout=5):
+        """Return a finished profile, waiting briefly if its request is still running."""
+        with self._lock:
+            profile = self._profiles.get(profile_id)
+        if profile is None or not profile["done"].wait(timeout):
+            return None
+        return profile
+
+    def snapshot(self):
+        labels = [str(bound) for bound in METRICS_BUCKETS] + ["+Inf"]
+        with self._lock:
+            routes = {
+                route: {
+                    "count": e["count"],
+                    "errors": e["errors"],
+                    "total": round(e["total"], 6),
+                    "mean": round(e["total"] / e["count"], 6),
+                    "max": round(e["max"], 6),
+                    "buckets": dict(zip(labels, e["buckets"])),
+                }
+                for route, e in sorted(self._routes.items())
+            }
+            processes = {
+                kind: {
+                    "count": e["count"],
+                    "total": round(e["total"], 6),
+                    "mean": round(e["total"] / e["count"], 6),
+                    "max": round(e["max"], 6),
+                }
+                for kind, e in sorted(self._processes.items())
+            }
+            profiles = [
+                {"id": p["id"], "route": p["route"], "seconds": round(p["seconds"], 6)}
+                for p in self._profiles.values()
+                if p["done"].is_set()
+            ]
+            return {
+                "uptime": round(time.time() - self._started, 3),
+                "routes": routes,
+                "subprocesses": processes,
+                "filesystem": dict(self._files),
+                "profiles": profiles,
+            }
+
+
+METRICS = Metrics()
+# cProfile can only run one profiler at a time, so profiled requests take turns
+_profile_lock = threading.Lock()
+
+# Route templates served under /api/; anything else shares one metrics key
+API_ROUTES = frozenset((
+    "/api/check-updates",
+    "/api/dependencies",
+    "/api/events",
+    "/api/health",
+    "/api/jobs",
+    "/api/jobs/{job}",
+    "/api/jobs/{job}/cancel",
+    "/api/metrics",
+    "/api/metrics/profiles/{profile}",
+    "/api/providers",
+    "/api/providers/add",
+    "/api/providers/select",
+    "/api/providers/{provider}",
+    "/api/settings",
+    "/api/skills",
+    "/api/skills/bulk",
+    "/api/skills/test-all",
+    "/api/skills/{id}",
+    "/api/skills/{id}/clear-auth",
+    "/api/skills/{id}/configure",
+    "/api/skills/{id}/dependencies",
+    "/api/skills/{id}/dependencies/install",
+    "/api/skills/{id}/install",
+    "/api/skills/{id}/install/{provider}",
+    "/api/skills/{id}/oauth",
+    "/api/skills/{id}/oauth-account",
+    "/api/skills/{id}/test",
+    "/api/skills/{id}/uninstall",
+    "/api/skills/{id}/uninstall/{provider}",
+    "/api/skills/{id}/update",
+    "/api/tests",
+    "/api/update",
+))
+
+
+def route_template(method, path):
+    """Collapse ids in a request path so metrics group by route.
+
+    Unknown /api/ paths all map to "/api/*" and unknown methods to "*",
+    so clients cannot grow the metrics table without bound.
+    """
+    if method not in ("GET", "POST", "DELETE", "OPTIONS"):
+        method = "*"
+    path = urllib.parse.urlsplit(path).path
+    if not path.startswith("/api/"):
+        return f"{method} /" if path in ("/", "/index.html") else f"{method} *"
+    parts = path.split("/")
+    if len(parts) > 3:
+        if parts[2] == "skills" and parts[3] not in ("bulk", "test-all"):
+            parts[3] = "{id}"
+            if len(parts) > 5 and parts[4] in ("install", "uninstall"):
+                parts[5] = "{provider}"
+        elif parts[2] == "jobs":
+            parts[3] = "{job}"
+        elif parts[2] == "providers" and parts[3] not in ("add", "select"):
+            parts[3] = "{provider}"
+        elif parts[2] == "metrics" and len(parts) > 4:
+            parts[4] = "{profile}"
+    template = "/".join(parts)
+    return f"{method} {template if template in API_ROUTES else '/api/*'}"
+
+
+def _process_kind(args):
+    """Name a subprocess for metrics by its executable."""
+    command = args.split(None, 1)[0] if isinstance(args, str) and args.strip() else args
+    if isinstance(command, (list, tuple)):
+        command = command[0] if command else ""
+    return os.path.basename(str(command)) or "unknown"
+
+
+# Parsed JSON files keyed by path: {path: ((mtime_ns, size), data)}
+_file_cache = {}
+_file_cache_lock = threading.Lock()
+# Per-thread snapshot pinned for the duration of one HTTP request
+_request_state = threading.local()
+
+
+def _stat_key(path):
+    """Return (mtime_ns, size) for a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
 
 
-def load_default_providers():
-    """Load default providers from providers.json."""
-    if not PROVIDERS_FILE.exists():
-        return {}
-    with open(PROVIDERS_FILE) as f:
+@contextlib.contextmanager
+def config_snapshot():
+    """Pin cached config files for the current thread until the block exits.
+
+    Nested blocks share the outermost snapshot.
+    """
+    previous = getattr(_request_state, "snapshot", None)
+    if previous is not None:
+        yield
+        return
+    _request_state.snapshot = {}
+    try:
+        yield
+    finally:
+        _request_state.snapshot = previous
+
+
+def load_cached_file(path, parse):
+    """Parse a file once and reuse the result until its mtime or size changes."""
+    snapshot = getattr(_request_state, "snapshot", None)
+    if snapshot is not None and path in snapshot:
+        return snapshot[path]
+
+    key = _stat_key(path)
+    with _file_cache_lock:
+        cached = _file_cache.get(path)
+    if cached and cached[0] == key:
+        data = cached[1]
+    else:
+        data = None
+        if key is not None:
+            data = parse(path)
+            METRICS.count_read(key[1])
+        with _file_cache_lock:
+            _file_cache[path] = (key, data)
+
+    if snapshot is not None and data is not None:
+        snapshot[path] = data
+    return data
+
+
+def store_cached_file(path, data):
+    """Record freshly written file contents so the next read skips parsing."""
+    with _file_cache_lock:
+        _file_cache[path] = (_stat_key(path), data)
+    snapshot = getattr(_request_state, "snapshot", None)
+    if snapshot is not None:
+        snapshot[path] = data
+
+
+def _parse_providers_file(path):
+    with open(path) as f:
         providers = json.load(f)
     return {
         p["id"]: {
@@ -43,10 +425,20 @@ def load_default_providers():
     }
 
 
+def _parse_json_file(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def load_default_providers():
+    """Load default providers from providers.json."""
+    return load_cached_file(PROVIDERS_FILE, _parse_providers_file) or {}
+
+
 def get_all_provider_ids():
     """Get list of all provider IDs (defaults + custom)."""
     defaults = set(load_default_providers().keys())
-    config = load_config()
+    config = read_config()
     config_ids = set(config.get("providers", {}).keys())
     return list(defaults | config_ids)
 
@@ -56,6 +448,7 @@ def is_custom_provider(provider_id):
     return provider_id not in load_default_providers()
 
 
+@serialized
 def init_config():
     """Initialize config directory and file with all providers enabled by default."""
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
@@ -80,38 +473,65 @@ def init_config():
         CONFIG_FILE.write_text(json.dumps(default_config, indent=2))
 
 
+def read_config():
+    """Return the cached provider configuration. Callers must not mutate it."""
+    config = load_cached_file(CONFIG_FILE, _parse_json_file)
+    if config is None:
+        init_config()
+        config = load_cached_file(CONFIG_FILE, _parse_json_file)
+    return config
+
+
 def load_config():
-    """Load provider configuration."""
-    init_config()
-    with open(CONFIG_FILE) as f:
-        return json.load(f)
+    """Load a private copy of the provider configuration for modification."""
+    return copy.deepcopy(read_config())
 
 
+@serialized
 def save_config(config):
-    """Save provider configuration."""
+    """Save provider configuration.
+
+    Written straight away so cli.sh and a killed server never see stale
+    settings; unchanged content is not rewritten.
+    """
     init_config()
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+    data = copy.deepcopy(config)
+    write_file_atomic(CONFIG_FILE, json.dumps(data, indent=2), 0o644)
+    store_cached_file(CONFIG_FILE, data)
 
 
 def get_enabled_providers():
     """Get list of enabled provider IDs."""
-    config = load_config()
+    config = read_config()
     return [
         pid for pid, info in config.get("providers", {}).items()
         if info.get("enabled", False)
     ]
 
 
+def get_install_mode():
+    """Get how skill files are installed: "copy" (default) or "link"."""
+    mode = read_config().get("install_mode", "copy")
+    return mode if mode in INSTALL_MODES else "copy"
+
+
+@serialized
+def set_install_mode(mode):
+    """Set the install mode used by later installs and updates."""
+    config = load_config()
+    config["install_mode"] = mode
+    save_config(config)
+
+
 def get_provider_path(provider_id):
     """Get install path for a provider."""
-    config = load_config()
+    config = read_config()
     return config.get("providers", {}).get(provider_id, {}).get("path", "")
 
 
 def get_providers_status():
     """Get all providers with their status."""
-    config = load_config()
+    config = read_config()
     selected = get_selected_provider()
     defaults = load_default_providers()
     result = []
@@ -140,7 +560,7 @@ def get_providers_status():
 
 def get_selected_provider():
     """Get the currently selected provider for viewing."""
-    config = load_config()
+    config = read_config()
     selected = config.get("selected_provider", "")
     enabled = get_enabled_providers()
 
@@ -149,13 +569,16 @@ def get_selected_provider():
     return selected
 
 
+@serialized
 def set_selected_provider(provider_id):
     """Set the selected provider for viewing."""
     config = load_config()
     config["selected_provider"] = provider_id
     save_config(config)
+    notify_providers_changed()
 
 
+@serialized
 def set_provider(provider_id, enabled, path=None, name=None, custom=False):
     """Enable or disable a provider."""
     config = load_config()
@@ -177,6 +600,7 @@ def set_provider(provider_id, enabled, path=None, name=None, custom=False):
 
     config["providers"][provider_id] = provider_data
     save_config(config)
+    notify_providers_changed()
 
 
 def add_custom_provider(provider_id, name, path):
@@ -184,67 +608,565 @@ def add_custom_provider(provider_id, name, path):
     set_provider(provider_id, enabled=True, path=path, name=name, custom=True)
 
 
+@serialized
 def remove_custom_provider(provider_id):
     """Remove a custom provider from config."""
     config = load_config()
     config.get("providers", {}).pop(provider_id, None)
     save_config(config)
+    notify_providers_changed()
+
+
+class EventBus:
+    """Fan-out of installer state changes to Server-Sent Events subscribers."""
+
+    def __init__(self, max_queue=EVENT_QUEUE_SIZE):
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._max_queue = max_queue
+
+    def has_subscribers(self):
+        with self._lock:
+            return bool(self._subscribers)
+
+    def subscribe(self):
+        """Return a queue that receives (event, data) tuples."""
+        events = queue.Queue(maxsize=self._max_queue)
+        with self._lock:
+            self._subscribers.add(events)
+        return events
+
+    def unsubscribe(self, events):
+        with self._lock:
+            self._subscribers.discard(events)
+
+    def publish(self, event, data):
+        """Send an event to every subscriber.
+
+        A client that falls behind loses its backlog and gets a single
+        "resync" event instead, telling it to reload its state.
+        """
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for events in subscribers:
+            try:
+                events.put_nowait((event, data))
+            except queue.Full:
+                with contextlib.suppress(queue.Empty):
+                    while True:
+                        events.get_nowait()
+                with contextlib.suppress(queue.Full):
+                    events.put_nowait(("resync", {}))
+
+
+EVENTS = EventBus()
+
+
+class SkillChanges:
+    """Coalesces per-provider status changes into one "skill" event per skill.
+
+    Changes are merged for EVENT_COALESCE_DELAY, so an operation touching
+    many skills or providers sends each skill once. Events carry only the
+    providers that changed, plus status when the selected provider did.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._timer = None
+
+    def add(self, skill_id, provider_status, status=None):
+        with self._lock:
+            change = self._pending.setdefault(skill_id, {"id": skill_id, "provider_status": {}})
+            change["provider_status"].update(provider_status)
+            if status is not None:
+                change["status"] = status
+            if self._timer is None:
+                self._timer = threading.Timer(EVENT_COALESCE_DELAY, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._timer = None
+        for change in pending.values():
+            EVENTS.publish("skill", change)
+
+
+SKILL_CHANGES = SkillChanges()
+
+
+def notify_skill_changed(skill_id, installs):
+    """Publish status changes of one skill to event subscribers.
+
+    installs maps each changed provider to its install details
+    ({"checksum", "has_env"}, see install_details) or None once removed.
+    Status comes from these details, so nothing is rescanned.
+    """
+    if not EVENTS.has_subscribers():
+        return
+    skill_data = SKILL_CATALOG.get(skill_id)
+    if skill_data is None:
+        return
+    selected = get_selected_provider()
+    provider_status = {}
+    status = None
+    for provider_id, installed in installs.items():
+        value = install_status(skill_id, skill_data, installed)
+        if provider_id == selected:
+            status = value
+        provider_status[provider_id] = "installed" if value == "configured" else value
+    SKILL_CHANGES.add(skill_id, provider_status, status)
 
 
-def check_for_updates():
-    """Check if there are updates available in the remote repository."""
-    if BUNDLED_MODE:
-        return {"has_updates": False}
+def notify_providers_changed():
+    """Publish the provider list to event subscribers."""
+    if EVENTS.has_subscribers():
+        EVENTS.publish("providers", get_providers_status())
 
-    repo_dir = SCRIPT_DIR.parent
 
-    fetch_result = subprocess.run(
-        ["git", "fetch"],
-        cwd=repo_dir,
-        capture_output=True,
-        text=True
-    )
-    if fetch_result.returncode != 0:
-        return {"has_updates": False, "error": fetch_result.stderr.strip()}
+def _terminate_process(proc):
+    """Terminate a process and, on POSIX, the shell children in its group."""
+    try:
+        if os.name == "posix":
+            os.killpg(proc.pid, signal.SIGTERM)
+        else:
+            proc.terminate()
+    except OSError:
+        pass
 
-    result = subprocess.run(
-        ["git", "status", "-uno"],
-        cwd=repo_dir,
-        capture_output=True,
-        text=True
+
+class JobCancelled(Exception):
+    """Raised inside a job when it has been cancelled."""
+
+
+class Job:
+    """A long-running installer operation executed on the job pool."""
+
+    def __init__(self, job_id, kind, skill_id=None):
+        self.id = job_id
+        self.kind = kind
+        self.skill_id = skill_id
+        self.state = "queued"
+        self.progress = 0.0
+        self.message = ""
+        self.output = []
+        self.result = None
+        self.status_code = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.future = None
+        self._cancel = threading.Event()
+        self._processes = set()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def check_cancelled(self):
+        """Raise JobCancelled if cancellation was requested."""
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def append_output(self, text):
+        with self._lock:
+            self.output.append(text)
+
+    def set_progress(self, progress, message=""):
+        with self._lock:
+            self.progress = max(0.0, min(1.0, progress))
+            if message:
+                self.message = message
+
+    def attach_process(self, proc):
+        with self._lock:
+            self._processes.add(proc)
+        if self._cancel.is_set():
+            _terminate_process(proc)
+
+    def detach_process(self, proc):
+        with self._lock:
+            self._processes.discard(proc)
+
+    def cancel(self):
+        """Request cancellation and terminate any running subprocess."""
+        self._cancel.set()
+        if self.future is not None and self.future.cancel():
+            self._finish("cancelled", None, None)
+        with self._lock:
+            processes = list(self._processes)
+        for proc in processes:
+            _terminate_process(proc)
+
+    def _start(self):
+        with self._lock:
+            self.state = "running"
+            self.started_at = time.time()
+
+    def _finish(self, state, result, status_code):
+        with self._lock:
+            self.state = state
+            self.result = result
+            self.status_code = status_code
+            self.finished_at = time.time()
+            if state == "succeeded":
+                self.progress = 1.0
+
+    def to_dict(self, output_offset=0):
+        with self._lock:
+            return {
+                "id": self.id,
+                "kind": self.kind,
+                "skill_id": self.skill_id,
+                "state": self.state,
+                "progress": self.progress,
+                "message": self.message,
+                "output": "".join(self.output[output_offset:]),
+                "output_offset": len(self.output),
+                "result": self.result,
+                "status_code": self.status_code,
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+            }
+
+
+class JobManager:
+    """Bounded worker pool that runs installer actions in the background."""
+
+    def __init__(self, max_workers, keep_finished=JOB_HISTORY_LIMIT):
+        self._executor = LazyThreadPool(max_workers, "installer-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._keep_finished = keep_finished
+
+    def submit(self, kind, action, *args, skill_id=None):
+        """Queue action(*args) and return its Job.
+
+        The action must return a (payload, http_status) tuple, like the
+        synchronous endpoint it replaces.
+        """
+        job = Job(os.urandom(6).hex(), kind, skill_id)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        job.future = self._executor.submit(self._run, job, action, args)
+        return job
+
+    def _run(self, job, action, args):
+        if job.cancelled:
+            return
+        job._start()
+        _job_state.job = job
+        try:
+            payload, status = action(*args)
+        except JobCancelled:
+            job._finish("cancelled", None, None)
+        except Exception as e:
+            job._finish("failed", {"error": str(e)}, 500)
+        else:
+            if job.cancelled:
+                job._finish("cancelled", payload, status)
+            else:
+                failed = status >= 400 or (isinstance(payload, dict) and payload.get("success") is False)
+                job._finish("failed" if failed else "succeeded", payload, status)
+        finally:
+            _job_state.job = None
+
+    def _prune(self):
+        finished = [j for j in self._jobs.values() if j.finished_at is not None]
+        finished.sort(key=lambda j: j.finished_at)
+        for job in finished[:max(0, len(finished) - self._keep_finished)]:
+            del self._jobs[job.id]
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return sorted(jobs, key=lambda j: j.created_at)
+
+
+JOBS = JobManager(JOB_WORKERS)
+_job_state = threading.local()
+
+
+def current_job():
+    """Return the Job running on this thread, or None outside the job pool."""
+    return getattr(_job_state, "job", None)
+
+
+def report_progress(progress, message=""):
+    """Update progress of the current job, if any."""
+    job = current_job()
+    if job is not None:
+        job.check_cancelled()
+        job.set_progress(progress, message)
+
+
+def run_in_job(job, func, *args):
+    """Call func on this thread as part of job, e.g. from a pool worker."""
+    _job_state.job = job
+    try:
+        return func(*args)
+    finally:
+        _job_state.job = None
+
+
+def run_process(args, cwd=None, shell=False, kind=None, timeout=None, prefix=""):
+    """Run a command and return a CompletedProcess with text stdout/stderr.
+
+    Inside a job, output is streamed into the job as it arrives (each line
+    starting with prefix) and the process is terminated if the job is
+    cancelled. kind names the command in metrics and defaults to the
+    executable name. After timeout seconds the process group is terminated
+    and subprocess.TimeoutExpired is raised with the output so far.
+    """
+    with METRICS.time_process(kind or _process_kind(args)):
+        return _run_process(args, cwd, shell, timeout, prefix)
+
+
+def _run_process(args, cwd, shell, timeout, prefix):
+    import subprocess
+    job = current_job()
+    if job is None and timeout is None:
+        return subprocess.run(args, cwd=cwd, shell=shell, capture_output=True, text=True)
+
+    if job is not None:
+        job.check_cancelled()
+    proc = subprocess.Popen(
+        args, cwd=cwd, shell=shell, text=True,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        start_new_session=(os.name == "posix"),
     )
-    has_updates = "Your branch is behind" in result.stdout
-    return {"has_updates": has_updates}
+    if job is not None:
+        job.attach_process(proc)
+    stdout, stderr = [], []
+
+    def pump(stream, sink):
+        for line in stream:
+            sink.append(line)
+            if job is not None:
+                job.append_output(prefix + line)
+
+    readers = [
+        threading.Thread(target=pump, args=(proc.stdout, stdout), daemon=True),
+        threading.Thread(target=pump, args=(proc.stderr, stderr), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    try:
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _terminate_process(proc)
+            proc.wait()
+            for reader in readers:
+                reader.join()
+            raise subprocess.TimeoutExpired(args, timeout, "".join(stdout), "".join(stderr))
+        for reader in readers:
+            reader.join()
+    finally:
+        if job is not None:
+            job.detach_process(proc)
+    if job is not None:
+        job.check_cancelled()
+    return subprocess.CompletedProcess(args, returncode, "".join(stdout), "".join(stderr))
+
+
+class UpdateChecker:
+    """Fetches the remote on a background thread and caches how far behind we are.
+
+    Successful fetches repeat every interval seconds. Failures back off
+    exponentially from UPDATE_CHECK_BACKOFF up to UPDATE_CHECK_MAX_BACKOFF.
+    """
+
+    def __init__(self, repo_dir, interval):
+        self.repo_dir = repo_dir
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._failures = 0
+        self._state = {
+            "behind": 0,
+            "last_fetch": None,
+            "last_attempt": None,
+            "next_fetch": None,
+            "error": None,
+        }
+
+    def start(self):
+        """Start the background fetcher if it is not running yet."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._loop, name="update-checker", daemon=True)
+            self._thread.start()
+
+    def trigger(self):
+        """Fetch as soon as possible instead of waiting for the interval."""
+        self.start()
+        self._wake.set()
+
+    def _loop(self):
+        while True:
+            delay = self._fetch_once()
+            with self._lock:
+                self._state["next_fetch"] = time.time() + delay
+            self._wake.wait(delay)
+            self._wake.clear()
+
+    def _git(self, *args, timeout=None):
+        import subprocess
+        env = dict(os.environ, GIT_TERMINAL_PROMPT="0")
+        with METRICS.time_process("git"):
+            return subprocess.run(
+                ["git", *args], cwd=self.repo_dir, env=env,
+                capture_output=True, text=True, timeout=timeout,
+            )
+
+    def _fetch_once(self):
+        import subprocess
+        attempted = time.time()
+        try:
+            result = self._git("fetch", "--quiet", timeout=GIT_FETCH_TIMEOUT)
+            error = None
+            if result.returncode != 0:
+                error = result.stderr.strip() or "git fetch failed"
+        except (OSError, subprocess.TimeoutExpired) as e:
+            error = str(e)
+
+        if error:
+            self._failures += 1
+            with self._lock:
+                self._state.update(last_attempt=attempted, error=error)
+            return min(UPDATE_CHECK_BACKOFF * 2 ** (self._failures - 1), UPDATE_CHECK_MAX_BACKOFF)
+
+        self._failures = 0
+        behind = self._count_behind()
+        with self._lock:
+            self._state.update(last_attempt=attempted, last_fetch=attempted, error=None)
+            if behind is not None:
+                self._state["behind"] = behind
+        return self.interval
+
+    def _count_behind(self):
+        try:
+            result = self._git("rev-list", "--count", "HEAD..@{u}")
+        except OSError:
+            return None
+        if result.returncode != 0:
+            return None
+        try:
+            return int(result.stdout.strip())
+        except ValueError:
+            return None
+
+    def refresh_local(self):
+        """Recount commits behind without fetching, e.g. after a pull."""
+        behind = self._count_behind()
+        if behind is not None:
+            with self._lock:
+                self._state["behind"] = behind
+
+    def status(self):
+        """Return the cached update state without touching the network."""
+        self.start()
+        with self._lock:
+            state = dict(self._state)
+        state["has_updates"] = state["behind"] > 0
+        return state
+
+
+UPDATE_CHECKER = UpdateChecker(SCRIPT_DIR.parent, UPDATE_CHECK_INTERVAL)
+
+
+def check_for_updates(refresh=False):
+    """Report whether the remote repository has updates, from cached state."""
+    if BUNDLED_MODE:
+        return {"has_updates": False}
+
+    if refresh:
+        UPDATE_CHECKER.trigger()
+    return UPDATE_CHECKER.status()
 
 
+@serialized
 def update_repo():
     """Pull latest changes from git repository and update installed skills."""
     if BUNDLED_MODE:
-        updated = update_installed_skills()
-        if updated:
-            install_word = "installation" if updated == 1 else "installations"
-            return {"success": True, "message": f"Updated {updated} installed skill {install_word}"}
-        return {"success": True, "message": "Updates managed by the app"}
+        report = update_installed_skills()
+        if report["updated"]:
+            return {"success": True, "message": _update_message(report["updated"]), **report}
+        return {"success": True, "message": "Updates managed by the app", **report}
 
     repo_dir = SCRIPT_DIR.parent
-    result = subprocess.run(
-        ["git", "pull"],
-        cwd=repo_dir,
-        capture_output=True,
-        text=True
-    )
+    before = git_head(repo_dir)
+    report_progress(0.1, "Pulling latest changes")
+    result = run_process(["git", "pull"], cwd=repo_dir)
     if result.returncode != 0:
         error = result.stderr.strip() or result.stdout.strip() or "Git pull failed"
         return {"success": False, "error": error}
 
-    updated = update_installed_skills()
+    after = git_head(repo_dir)
+    changed = changed_skill_ids(repo_dir, before, after)
+    UPDATE_CHECKER.refresh_local()
+
+    report_progress(0.6, "Updating installed skills")
+    report = update_installed_skills(changed)
+    if before != after:
+        EVENTS.publish("catalog", {"reason": "update"})
+    report["changed_skills"] = sorted(changed) if changed is not None else None
     output = result.stdout.strip()
-    if updated:
-        install_word = "installation" if updated == 1 else "installations"
-        return {"success": True, "message": f"Updated {updated} installed skill {install_word}"}
+    if report["updated"]:
+        return {"success": True, "message": _update_message(report["updated"]), **report}
     if "Already up to date" in output:
-        return {"success": True, "message": "Already up to date"}
-    return {"success": True, "message": "Skills updated"}
+        return {"success": True, "message": "Already up to date", **report}
+    return {"success": True, "message": "Skills updated", **report}
+
+
+def git_head(repo_dir):
+    """Return the commit id of HEAD, or None if it cannot be resolved."""
+    result = run_process(["git", "rev-parse", "HEAD"], cwd=repo_dir)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def changed_skill_ids(repo_dir, before, after):
+    """Return ids of skills whose files differ between two commits.
+
+    Returns None when the change set cannot be determined, in which case
+    every skill should be checked.
+    """
+    if not before or not after:
+        return None
+    if before == after:
+        return set()
+
+    skills_rel = os.path.relpath(SKILLS_DIR, repo_dir)
+    if skills_rel.startswith(".."):
+        return None
+
+    result = run_process(
+        ["git", "diff", "--name-only", before, after, "--", skills_rel],
+        cwd=repo_dir,
+    )
+    if result.returncode != 0:
+        return None
+
+    prefix = Path(skills_rel).as_posix().rstrip("/") + "/"
+    changed = set()
+    for name in result.stdout.splitlines():
+        if name.startswith(prefix):
+            skill_id = name[len(prefix):].split("/", 1)[0]
+            if skill_id:
+                changed.add(skill_id)
+    return changed
 
 
 def get_os():
@@ -260,14 +1182,121 @@ def get_os():
     return "unknown"
 
 
-def check_dependencies(skill_data):
+class DependencyProbe:
+    """Runs dependency check commands concurrently with a timeout.
+
+    Identical commands are run once even when several skills or requests
+    ask for them at the same time, and results are cached for ttl seconds.
+    """
+
+    def __init__(self, ttl, timeout, max_workers):
+        self.ttl = ttl
+        self.timeout = timeout
+        self._executor = LazyThreadPool(max_workers, "dependency-check")
+        self._results = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def _run(self, check_cmd):
+        with METRICS.time_process("dependency-check"):
+            installed = self._probe(check_cmd)
+        with self._lock:
+            self._results[check_cmd] = (time.monotonic(), installed)
+            self._pending.pop(check_cmd, None)
+        return installed
+
+    def _probe(self, check_cmd):
+        import subprocess
+        try:
+            proc = subprocess.Popen(
+                check_cmd, shell=True,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                start_new_session=(os.name == "posix"),
+            )
+            try:
+                installed = proc.wait(timeout=self.timeout) == 0
+            except subprocess.TimeoutExpired:
+                _terminate_process(proc)
+                proc.wait()
+                installed = False
+        except OSError:
+            installed = False
+        return installed
+
+    def check_many(self, commands):
+        """Return {command: installed} for every command, probing stale ones."""
+        now = time.monotonic()
+        results = {}
+        futures = {}
+        with self._lock:
+            for check_cmd in set(commands):
+                cached = self._results.get(check_cmd)
+                if cached and now - cached[0] < self.ttl:
+                    results[check_cmd] = cached[1]
+                    continue
+                future = self._pending.get(check_cmd)
+                if future is None:
+                    future = self._executor.submit(self._run, check_cmd)
+                    self._pending[check_cmd] = future
+                futures[check_cmd] = future
+        for check_cmd, future in futures.items():
+            results[check_cmd] = future.result()
+        return results
+
+    def record(self, check_cmd, installed):
+        """Store a result obtained outside the probe."""
+        with self._lock:
+            self._results[check_cmd] = (time.monotonic(), installed)
+
+    def invalidate(self, commands=None):
+        """Forget cached results for commands, or for every command."""
+        with self._lock:
+            if commands is None:
+                self._results.clear()
+            else:
+                for check_cmd in commands:
+                    self._results.pop(check_cmd, None)
+
+
+DEPENDENCY_PROBE = DependencyProbe(
+    DEPENDENCY_CHECK_TTL, DEPENDENCY_CHECK_TIMEOUT, DEPENDENCY_CHECK_WORKERS
+)
+
+
+def _system_dependencies(skill_data):
+    """Return dependency specs with check/install commands.
+
+    Plain strings in "dependencies" name other skills and are not probed.
+    """
+    return [dep for dep in skill_data.get("dependencies", []) if isinstance(dep, dict)]
+
+
+def _dependency_checks(skills):
+    return [
+        dep["check"]
+        for skill_data in skills
+        for dep in _system_dependencies(skill_data)
+        if dep.get("check")
+    ]
+
+
+def check_all_dependencies():
+    """Check dependencies of every skill, probing each distinct command once."""
+    skills = [s for s in SKILL_CATALOG.all() if _system_dependencies(s)]
+    probed = DEPENDENCY_PROBE.check_many(_dependency_checks(skills))
+    return {s["id"]: check_dependencies(s, probed) for s in skills}
+
+
+def check_dependencies(skill_data, probed=None):
     """Check if skill dependencies are installed."""
-    deps = skill_data.get("dependencies", [])
+    deps = _system_dependencies(skill_data)
     if not deps:
         return {"has_dependencies": False, "all_installed": True, "dependencies": []}
 
     os_name = get_os()
     results = []
+    if probed is None:
+        probed = DEPENDENCY_PROBE.check_many(_dependency_checks([skill_data]))
 
     for dep in deps:
         name = dep.get("name", "Unknown")
@@ -275,10 +1304,7 @@ def check_dependencies(skill_data):
         install_cmds = dep.get("install", {})
         install_cmd = install_cmds.get(os_name, "")
 
-        installed = False
-        if check_cmd:
-            result = subprocess.run(check_cmd, shell=True, capture_output=True)
-            installed = result.returncode == 0
+        installed = probed.get(check_cmd, False) if check_cmd else False
 
         results.append({
             "name": name,
@@ -298,7 +1324,7 @@ def check_dependencies(skill_data):
 
 def install_dependencies(skill_data):
     """Install missing skill dependencies for the current OS."""
-    deps = skill_data.get("dependencies", [])
+    deps = _system_dependencies(skill_data)
     if not deps:
         return {"success": True, "message": "No dependencies to install", "installed": []}
 
@@ -306,28 +1332,36 @@ def install_dependencies(skill_data):
     installed = []
     errors = []
 
-    for dep in deps:
+    # Probe every check up front, concurrently and without stale results
+    check_cmds = _dependency_checks([skill_data])
+    DEPENDENCY_PROBE.invalidate(check_cmds)
+    report_progress(0.0, "Checking dependencies")
+    probed = DEPENDENCY_PROBE.check_many(check_cmds)
+
+    for index, dep in enumerate(deps):
         name = dep.get("name", "Unknown")
         check_cmd = dep.get("check", "")
         install_cmd = dep.get("install", {}).get(os_name, "")
 
-        if check_cmd:
-            check = subprocess.run(check_cmd, shell=True, capture_output=True, text=True)
-            if check.returncode == 0:
-                continue
+        if check_cmd and probed.get(check_cmd):
+            continue
 
         if not install_cmd:
             errors.append(f"No install command for {name} on {os_name}")
             continue
 
-        result = subprocess.run(install_cmd, shell=True, capture_output=True, text=True)
+        report_progress(index / len(deps), f"Installing {name}")
+        result = run_process(install_cmd, shell=True, kind="dependency-install")
+        # A package manager run can satisfy checks of other skills too
+        DEPENDENCY_PROBE.invalidate()
         output = (result.stdout or "") + (result.stderr or "")
         if result.returncode != 0:
             errors.append(f"{name} install failed:\n{output.strip()}")
             continue
 
         if check_cmd:
-            check = subprocess.run(check_cmd, shell=True, capture_output=True, text=True)
+            check = run_process(check_cmd, shell=True, kind="dependency-check")
+            DEPENDENCY_PROBE.record(check_cmd, check.returncode == 0)
             if check.returncode != 0:
                 check_output = (check.stdout or "") + (check.stderr or "")
                 errors.append(
@@ -351,34 +1385,472 @@ def install_dependencies(skill_data):
     }
 
 
+def _file_signature(path):
+    """Return [size, mtime_ns, inode] for a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+def hash_file(path):
+    """Return the sha256 hex digest of a file, read in HASH_CHUNK_SIZE chunks."""
+    import hashlib
+    hasher = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+            size += len(chunk)
+    METRICS.count_read(size)
+    return hasher.hexdigest()
+
+
+class ChecksumCache:
+    """File and skill checksums keyed by (path, size, mtime_ns, inode).
+
+    Entries are persisted to CHECKSUM_CACHE_FILE so a restart only re-hashes
+    skills whose files changed. Only files under root (the repo's skill
+    sources) are kept. Misses mark the cache dirty and it is written once,
+    CHECKSUM_SAVE_DELAY after the first of a burst, or by flush(). Files
+    are hashed in chunks and never read into memory whole.
+    """
+
+    def __init__(self, path, root):
+        self.path = path
+        self.root = root
+        self._lock = threading.Lock()
+        self._files = None
+        self._skills = None
+        self._dirty = False
+        self._timer = None
+
+    def _ensure_loaded(self):
+        if self._files is not None:
+            return
+        files, skills = {}, {}
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            METRICS.count_read()
+            if data.get("version") == CHECKSUM_CACHE_VERSION:
+                files = data.get("files", {})
+                skills = data.get("skills", {})
+        except (OSError, ValueError):
+            pass
+        self._files = files
+        self._skills = skills
+
+    def _mark_dirty(self):
+        self._dirty = True
+        if self._timer is None:
+            self._timer = threading.Timer(CHECKSUM_SAVE_DELAY, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _prune(self):
+        """Drop entries for paths outside root or no longer on disk."""
+        root = os.path.join(str(self.root), "")
+
+        def keep(path):
+            return path.startswith(root) and os.path.exists(path)
+
+        self._files = {k: v for k, v in self._files.items() if keep(k)}
+        self._skills = {
+            k: v for k, v in self._skills.items()
+            if any(keep(path) for path in k.split("\n"))
+        }
+
+    def flush(self):
+        """Write pending entries to CHECKSUM_CACHE_FILE."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._prune()
+            data = {"version": CHECKSUM_CACHE_VERSION, "files": self._files, "skills": self._skills}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                METRICS.count_write(tmp_path.write_text(json.dumps(data)))
+                os.replace(tmp_path, self.path)
+            except OSError:
+                pass
+
+    def file_digest(self, path):
+        """Return the full sha256 hex digest of a file, or None if missing."""
+        key = str(path)
+        signature = _file_signature(path)
+        if signature is None:
+            return None
+        with self._lock:
+            self._ensure_loaded()
+            cached = self._files.get(key)
+            if cached and cached[:3] == signature:
+                return cached[3]
+
+        digest = hash_file(path)
+        with self._lock:
+            self._files[key] = signature + [digest]
+            self._mark_dirty()
+        return digest
+
+    def combined_checksum(self, paths):
+        """Return the short sha256 of the concatenated contents of paths.
+
+        Missing paths are skipped. The result matches hashing every file's
+        bytes in order, which is what cli.sh writes to .checksum.
+        """
+        key = "\n".join(str(p) for p in paths)
+        signatures = [_file_signature(p) for p in paths]
+        with self._lock:
+            self._ensure_loaded()
+            cached = self._skills.get(key)
+            if cached and cached[0] == signatures:
+                return cached[1]
+
+        import hashlib
+        combined = hashlib.sha256()
+        file_entries = {}
+        for path, signature in zip(paths, signatures):
+            if signature is None:
+                continue
+            hasher = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    combined.update(chunk)
+                    hasher.update(chunk)
+            METRICS.count_read(signature[0])
+            file_entries[str(path)] = signature + [hasher.hexdigest()]
+        checksum = combined.hexdigest()[:16]
+
+        with self._lock:
+            self._files.update(file_entries)
+            self._skills[key] = [signatures, checksum]
+            self._mark_dirty()
+        return checksum
+
+
+CHECKSUM_CACHE = ChecksumCache(CHECKSUM_CACHE_FILE, SKILLS_DIR)
+
+
+class SkillBundle:
+    """Read-only view of a skills archive written by build_skill_bundle.
+
+    The file is mmapped and its JSON index parsed on first use. File
+    contents are served as memoryview slices of the map, never read whole.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._skills = None
+        self._map = None
+        self._data_start = 0
+
+    def _ensure_loaded(self):
+        with self._lock:
+            if self._skills is None:
+                import mmap
+                with open(self.path, "rb") as f:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                magic, version, index_offset, index_size = BUNDLE_HEADER.unpack_from(self._map)
+                if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+                    raise ValueError(f"Unsupported skill bundle: {self.path}")
+                self._skills = json.loads(self._map[index_offset:index_offset + index_size])["skills"]
+                self._data_start = BUNDLE_HEADER.size
+                METRICS.count_read(index_size)
+            return self._skills
+
+    def ids(self):
+        return sorted(self._ensure_loaded())
+
+    def manifest(self, skill_id):
+        """Return the parsed skill.json of a skill, or None."""
+        entry = self._ensure_loaded().get(skill_id)
+        return entry["manifest"] if entry else None
+
+    def checksum(self, skill_id):
+        """Return the combined checksum computed at build time, or None."""
+        entry = self._ensure_loaded().get(skill_id)
+        return entry["checksum"] if entry else None
+
+    def file_entry(self, skill_id, src):
+        """Return {"offset", "size", "sha256"} for a skill file, or None."""
+        entry = self._ensure_loaded().get(skill_id)
+        return entry["files"].get(src) if entry else None
+
+    def view(self, file_entry):
+        """Return a file's bytes as a memoryview into the map."""
+        self._ensure_loaded()
+        start = self._data_start + file_entry["offset"]
+        return memoryview(self._map)[start:start + file_entry["size"]]
+
+
+def build_skill_bundle(skills_dir, out_path):
+    """Pack every skill under skills_dir into one indexed archive at out_path.
+
+    Layout: BUNDLE_HEADER, file contents back to back, then the JSON index.
+    Files are streamed into the archive in HASH_CHUNK_SIZE chunks and the
+    header is patched with the index position once it is known. The index
+    holds per skill the parsed skill.json, the combined checksum (as
+    compute_skill_checksum would give) and, per source file, its offset
+    into the data section, size and sha256. Returns the number of skills.
+    """
+    import hashlib
+    out_path = Path(out_path)
+    tmp_path = _temp_path(out_path)
+    skills = {}
+    try:
+        with open(tmp_path, "wb") as out:
+            out.write(BUNDLE_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, 0, 0))
+            offset = 0
+            for skill_dir in sorted(Path(skills_dir).iterdir()):
+                skill_json = skill_dir / "skill.json"
+                if not skill_json.is_file():
+                    continue
+                manifest = json.loads(skill_json.read_text())
+                manifest["id"] = skill_dir.name
+                combined = hashlib.sha256()
+                files = {}
+                for file_spec in sorted(manifest.get("files", [])):
+                    src = file_spec.split(":")[0] if ":" in file_spec else file_spec
+                    path = skill_dir / src
+                    if not path.is_file():
+                        continue
+                    # A source listed twice counts twice in the checksum but is stored once
+                    store = src not in files
+                    hasher = hashlib.sha256()
+                    size = 0
+                    with open(path, "rb") as f:
+                        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                            combined.update(chunk)
+                            if store:
+                                hasher.update(chunk)
+                                out.write(chunk)
+                                size += len(chunk)
+                    if store:
+                        files[src] = {"offset": offset, "size": size, "sha256": hasher.hexdigest()}
+                        offset += size
+                skills[skill_dir.name] = {"manifest": manifest, "checksum": combined.hexdigest()[:16], "files": files}
+
+            index = json.dumps({"skills": skills}, separators=(",", ":")).encode()
+            out.write(index)
+            out.seek(0)
+            out.write(BUNDLE_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, BUNDLE_HEADER.size + offset, len(index)))
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    return len(skills)
+
+
+SKILL_BUNDLE = SkillBundle(SKILLS_BUNDLE_FILE) if SKILLS_BUNDLE_FILE else None
+
+
 def compute_skill_checksum(skill_id, skill_data):
-    """Compute checksum of skill files in the repo."""
+    """Compute checksum of skill files in the repo (or the skill bundle)."""
+    if SKILL_BUNDLE is not None:
+        return SKILL_BUNDLE.checksum(skill_id)
     skill_dir = SKILLS_DIR / skill_id
     files = skill_data.get("files", [])
 
-    hasher = hashlib.sha256()
+    sources = []
     for file_spec in sorted(files):
         src = file_spec.split(":")[0] if ":" in file_spec else file_spec
-        src_path = skill_dir / src
-        if src_path.exists():
-            hasher.update(src_path.read_bytes())
+        sources.append(skill_dir / src)
+
+    return CHECKSUM_CACHE.combined_checksum(sources)
+
+
+class SkillCatalog:
+    """Parsed skill.json documents keyed by skill id.
+
+    The directory listing is refreshed when SKILLS_DIR's mtime changes and
+    each entry is re-parsed only when its own skill.json changes.
+    """
+
+    def __init__(self, skills_dir):
+        self.skills_dir = skills_dir
+        self._lock = threading.Lock()
+        self._dir_key = None
+        self._ids = []
+        self._id_set = set()
+        self._entries = {}
+
+    def _refresh_ids(self):
+        key = _stat_key(self.skills_dir)
+        with self._lock:
+            if key != self._dir_key:
+                ids = []
+                if key is not None:
+                    with os.scandir(self.skills_dir) as it:
+                        ids = sorted(e.name for e in it if e.is_dir())
+                self._ids = ids
+                self._id_set = set(ids)
+                self._dir_key = key
+                for stale in set(self._entries) - self._id_set:
+                    del self._entries[stale]
+
+    def ids(self):
+        """Return sorted ids of directories that may hold a skill."""
+        self._refresh_ids()
+        return list(self._ids)
+
+    def _load(self, skill_id):
+        skill_json = self.skills_dir / skill_id / "skill.json"
+        key = _stat_key(skill_json)
+        with self._lock:
+            cached = self._entries.get(skill_id)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        data = None
+        if key is not None:
+            with open(skill_json) as f:
+                data = json.load(f)
+            METRICS.count_read(key[1])
+            data["id"] = skill_id
+        with self._lock:
+            self._entries[skill_id] = (key, data)
+        return data
 
-    return hasher.hexdigest()[:16]
+    def get(self, skill_id):
+        """Return a copy of one skill's data, or None if it does not exist."""
+        self._refresh_ids()
+        if skill_id not in self._id_set:
+            return None
+        data = self._load(skill_id)
+        return dict(data) if data is not None else None
 
+    def all(self):
+        """Return copies of every skill's data, sorted by id."""
+        skills = []
+        for skill_id in self.ids():
+            data = self._load(skill_id)
+            if data is not None:
+                skills.append(dict(data))
+        return skills
 
-def get_skills():
-    """Get list of available skills."""
-    skills = []
-    for skill_dir in sorted(SKILLS_DIR.iterdir()):
-        skill_json = skill_dir / "skill.json"
-        if skill_json.exists():
-            with open(skill_json) as f:
-                data = json.load(f)
-                data["id"] = skill_dir.name
-                data["status"] = get_skill_status(skill_dir.name, data)
-                data["provider_status"] = get_skill_provider_status(skill_dir.name, data)
-                skills.append(data)
-    return skills
+
+class BundleCatalog:
+    """SkillCatalog counterpart serving skill.json data from the bundle index."""
+
+    def __init__(self, bundle):
+        self.bundle = bundle
+
+    def ids(self):
+        return self.bundle.ids()
+
+    def get(self, skill_id):
+        data = self.bundle.manifest(skill_id)
+        return dict(data) if data is not None else None
+
+    def all(self):
+        return [dict(self.bundle.manifest(skill_id)) for skill_id in self.bundle.ids()]
+
+
+SKILL_CATALOG = BundleCatalog(SKILL_BUNDLE) if SKILL_BUNDLE else SkillCatalog(SKILLS_DIR)
+
+
+def with_status(skill_data, provider=None, fields=None):
+    """Attach selected-provider and per-provider status to skill data.
+
+    With provider, both are computed for that provider only. With fields,
+    status and provider_status are each skipped unless listed.
+    """
+    skill_id = skill_data["id"]
+    if fields is None or "status" in fields:
+        if provider is None:
+            skill_data["status"] = get_skill_status(skill_id, skill_data)
+        else:
+            skill_data["status"] = get_skill_status_for_provider(skill_id, skill_data, provider)
+    if fields is None or "provider_status" in fields:
+        provider_ids = None if provider is None else [provider]
+        skill_data["provider_status"] = get_skill_provider_status(skill_id, skill_data, provider_ids)
+    return skill_data
+
+
+def get_skills(fields=None, ids=None, provider=None):
+    """Get list of available skills.
+
+    fields limits each entry to those keys (id is always kept) and skips
+    checksum and status work unless status or provider_status is among
+    them. ids limits the result to those skills, in that order. provider
+    computes status for that provider instead of the selected/enabled ones.
+    """
+    with config_snapshot():
+        if ids is None:
+            skills = SKILL_CATALOG.all()
+        else:
+            skills = [data for data in map(SKILL_CATALOG.get, ids) if data is not None]
+        if fields is None:
+            return [with_status(data, provider) for data in skills]
+
+        wanted = set(fields) | {"id"}
+        result = []
+        for data in skills:
+            if wanted & {"status", "provider_status"}:
+                with_status(data, provider, wanted)
+            result.append({key: value for key, value in data.items() if key in wanted})
+        return result
+
+
+_prewarmed = threading.Event()
+
+
+def prewarm():
+    """Load the catalog, statuses and page template ahead of the first request."""
+    try:
+        get_skills()
+        load_cached_file(TEMPLATES_DIR / "index.html", _parse_template)
+    finally:
+        _prewarmed.set()
+
+
+def get_skill(skill_id):
+    """Get a single skill with its status, or None if it does not exist."""
+    data = SKILL_CATALOG.get(skill_id)
+    return with_status(data) if data is not None else None
+
+
+def get_status_report(skill_ids=None):
+    """Return enabled providers and each skill's status per provider.
+
+    Backs web.py --status-json, so cli.sh renders a screen from one process
+    instead of re-deriving checksums and statuses in bash.
+    """
+    with config_snapshot():
+        # Config order, like get_enabled_providers, so output is stable across runs
+        by_id = {p["id"]: p for p in get_providers_status()}
+        providers = [by_id[pid] for pid in get_enabled_providers() if pid in by_id]
+        skills = []
+        for data in SKILL_CATALOG.all():
+            skill_id = data["id"]
+            if skill_ids and skill_id not in skill_ids:
+                continue
+            skills.append({
+                "id": skill_id,
+                "title": data.get("title", skill_id),
+                "description": data.get("description", ""),
+                "version": data.get("version", ""),
+                "needs_config": skill_needs_config(data),
+                "has_test": bool(data.get("test_command")),
+                "has_dependencies": bool(data.get("dependencies")),
+                "providers": {
+                    p["id"]: {
+                        "status": get_skill_status_for_provider(skill_id, data, p["id"]),
+                        "path": get_install_path(skill_id, p["id"]),
+                    }
+                    for p in providers
+                },
+            })
+    return {"providers": providers, "skills": skills}
 
 
 def get_install_path(skill_id, provider_id):
@@ -400,25 +1872,165 @@ def skill_needs_config(skill_data):
     return len(skill_data.get("fields", [])) > 0
 
 
-def get_skill_provider_status(skill_id, skill_data):
-    """Get installation status per provider."""
+def read_manifest(root):
+    """Return the {skill_id: entry} map from a provider root's install manifest.
+
+    Each entry records the combined checksum, the sha256 of every installed
+    file keyed by install name, installed_at, config_hash (short sha256 of
+    the installed .env, or None) and linked, the install names of files
+    that are links into the store.
+    """
+    try:
+        with open(os.path.join(root, MANIFEST_NAME)) as f:
+            data = json.load(f)
+        METRICS.count_read()
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data.get("skills", {})
+
+
+@contextlib.contextmanager
+def edit_manifest(provider_id):
+    """Read-modify-write a provider's install manifest as one transaction.
+
+    Yields the mutable {skill_id: entry} map, which is written atomically
+    when the block exits normally and discarded if it raises. The provider
+    lock serializes threads; an flock on the provider root serializes
+    processes, e.g. cli.sh running next to the server. Directories cannot
+    be opened on Windows, where fcntl is missing, so only threads are
+    serialized there.
+    """
+    root = get_provider_path(provider_id)
+    with provider_lock(provider_id):
+        os.makedirs(root, exist_ok=True)
+        fd = os.open(root, os.O_RDONLY) if fcntl is not None else None
+        try:
+            if fd is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            skills = read_manifest(root)
+            before = copy.deepcopy(skills)
+            yield skills
+            if skills != before:
+                content = json.dumps({"version": MANIFEST_VERSION, "skills": skills}, indent=2, sort_keys=True)
+                write_file_atomic(Path(root) / MANIFEST_NAME, content + "\n", 0o644)
+        finally:
+            if fd is not None:
+                os.close(fd)
+    invalidate_install_scans()
+
+
+def config_hash(content):
+    """Short sha256 of .env content, as recorded in install manifests."""
+    import hashlib
+    return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+
+def install_details(entry):
+    """Return InstallScan-style {"checksum", "has_env"} for a manifest entry."""
+    return {"checksum": entry.get("checksum"), "has_env": entry.get("config_hash") is not None}
+
+
+class InstallScan:
+    """Skill directories installed under one provider root.
+
+    The root is listed with a single os.scandir call and its install
+    manifest is read once. Skills missing from the manifest (installed by
+    older versions) are inspected when first looked up, with one more
+    scandir for .checksum/.env presence and a read of .checksum.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._dirs = {}
+        self._details = {}
+        self._manifest = {}
+        if not root:
+            return
+        self._manifest = read_manifest(root)
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        self._dirs[entry.name] = entry.path
+        except OSError:
+            pass
+
+    def get(self, skill_id):
+        """Return {"checksum", "has_env"} for an installed skill, or None."""
+        path = self._dirs.get(skill_id)
+        if path is None:
+            return None
+        details = self._details.get(skill_id)
+        if details is None:
+            entry = self._manifest.get(skill_id)
+            if entry is not None:
+                details = install_details(entry)
+            else:
+                details = self._probe_legacy(path)
+            self._details[skill_id] = details
+        return details
+
+    def _probe_legacy(self, path):
+        details = {"checksum": None, "has_env": False}
+        METRICS.count_scan()
+        try:
+            with os.scandir(path) as it:
+                names = {entry.name for entry in it if entry.is_file()}
+        except OSError:
+            names = set()
+        details["has_env"] = ".env" in names
+        if ".checksum" in names:
+            try:
+                with open(os.path.join(path, ".checksum")) as f:
+                    details["checksum"] = f.read().strip()
+                METRICS.count_read()
+            except OSError:
+                pass
+        return details
+
+
+def scan_provider(provider_id):
+    """Return the InstallScan for a provider, shared for the current snapshot."""
+    root = get_provider_path(provider_id)
+    snapshot = getattr(_request_state, "snapshot", None)
+    key = ("install-scan", root)
+    if snapshot is not None and key in snapshot:
+        return snapshot[key]
+    scan = InstallScan(root)
+    if snapshot is not None:
+        snapshot[key] = scan
+    return scan
+
+
+def invalidate_install_scans():
+    """Drop install scans from the current snapshot after writing to providers."""
+    snapshot = getattr(_request_state, "snapshot", None)
+    if snapshot is None:
+        return
+    for key in [k for k in snapshot if isinstance(k, tuple) and k[0] == "install-scan"]:
+        del snapshot[key]
+
+
+def get_skill_provider_status(skill_id, skill_data, provider_ids=None):
+    """Get installation status per provider (all enabled providers by default)."""
     result = {}
-    repo_checksum = compute_skill_checksum(skill_id, skill_data)
+    repo_checksum = None
 
-    for provider_id in get_enabled_providers():
-        install_path = get_install_path(skill_id, provider_id)
-        if not install_path or not os.path.isdir(install_path):
+    for provider_id in get_enabled_providers() if provider_ids is None else provider_ids:
+        installed = scan_provider(provider_id).get(skill_id)
+        if installed is None:
             result[provider_id] = "not_installed"
             continue
 
-        checksum_file = os.path.join(install_path, ".checksum")
-        if not os.path.isfile(checksum_file):
+        if installed["checksum"] is None:
             result[provider_id] = "outdated"
             continue
 
-        with open(checksum_file) as f:
-            installed_checksum = f.read().strip()
-        if installed_checksum != repo_checksum:
+        if repo_checksum is None:
+            repo_checksum = compute_skill_checksum(skill_id, skill_data)
+        if installed["checksum"] != repo_checksum:
             result[provider_id] = "outdated"
             continue
 
@@ -429,29 +2041,31 @@ def get_skill_provider_status(skill_id, skill_data):
 
 def get_skill_status(skill_id, skill_data):
     """Get installation status of a skill for the selected provider."""
-    provider_id = get_selected_provider()
+    return get_skill_status_for_provider(skill_id, skill_data, get_selected_provider())
+
+
+def get_skill_status_for_provider(skill_id, skill_data, provider_id):
+    """Get installation status of a skill for one provider, including config state."""
     if not provider_id:
         return "not_installed"
+    return install_status(skill_id, skill_data, scan_provider(provider_id).get(skill_id))
 
-    install_path = get_install_path(skill_id, provider_id)
-    if not install_path or not os.path.isdir(install_path):
-        return "not_installed"
 
-    repo_checksum = compute_skill_checksum(skill_id, skill_data)
+def install_status(skill_id, skill_data, installed):
+    """Status of one install given its InstallScan details (None if not installed)."""
+    if installed is None:
+        return "not_installed"
 
-    checksum_file = os.path.join(install_path, ".checksum")
-    if not os.path.isfile(checksum_file):
+    if installed["checksum"] is None:
         return "outdated"
 
-    with open(checksum_file) as f:
-        installed_checksum = f.read().strip()
-    if installed_checksum != repo_checksum:
+    if installed["checksum"] != compute_skill_checksum(skill_id, skill_data):
         return "outdated"
 
     if not skill_needs_config(skill_data):
         return "configured"
 
-    if os.path.isfile(os.path.join(install_path, ".env")):
+    if installed["has_env"]:
         return "configured"
 
     return "installed"
@@ -459,29 +2073,83 @@ def get_skill_status(skill_id, skill_data):
 
 def installed_skill_is_outdated(skill_id, skill_data, provider_id):
     """Return true when an installed skill differs from the repo copy."""
-    install_path = get_install_path(skill_id, provider_id)
-    if not install_path or not os.path.isdir(install_path):
+    installed = scan_provider(provider_id).get(skill_id)
+    if installed is None:
         return False
 
-    checksum_file = os.path.join(install_path, ".checksum")
-    if not os.path.isfile(checksum_file):
+    if installed["checksum"] is None:
         return True
 
-    with open(checksum_file) as f:
-        installed_checksum = f.read().strip()
-    return installed_checksum != compute_skill_checksum(skill_id, skill_data)
+    return installed["checksum"] != compute_skill_checksum(skill_id, skill_data)
 
 
-def install_files_to_provider(skill_id, skill_data, provider_id):
-    """Install skill files to a specific provider."""
-    skill_dir = SKILLS_DIR / skill_id
-    install_path = get_install_path(skill_id, provider_id)
+def _temp_path(path):
+    """Return a sibling temp path unique to this process and thread."""
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
 
-    if not install_path:
+
+def _kernel_copy(src_path, dst_path):
+    """Copy file contents without passing them through Python buffers.
+
+    Uses copy_file_range where the OS has it and falls back to
+    shutil.copyfile, which uses sendfile on Linux and fcopyfile on macOS.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src_path, "rb") as fsrc, open(dst_path, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+        except OSError:
+            pass
+    shutil.copyfile(src_path, dst_path)
+
+
+def _is_linked(path):
+    """True when path is a symlink or shares its inode with another name."""
+    try:
+        return os.path.islink(path) or os.stat(path).st_nlink > 1
+    except OSError:
         return False
 
-    os.makedirs(install_path, exist_ok=True)
 
+class SkillFile:
+    """A skill source file in SKILLS_DIR."""
+
+    def __init__(self, path):
+        self.path = path
+        self.size = path.stat().st_size
+
+    def digest(self):
+        return CHECKSUM_CACHE.file_digest(self.path)
+
+    def copy_to(self, dst_path):
+        _kernel_copy(self.path, dst_path)
+
+
+class BundledSkillFile:
+    """A skill source file in the skill bundle, copied straight from the map."""
+
+    def __init__(self, bundle, entry):
+        self.bundle = bundle
+        self.entry = entry
+        self.size = entry["size"]
+
+    def digest(self):
+        return self.entry["sha256"]
+
+    def copy_to(self, dst_path):
+        with open(dst_path, "wb") as f:
+            f.write(self.bundle.view(self.entry))
+
+
+def skill_source_files(skill_id, skill_data):
+    """Yield (install name, source file) for each of a skill's files that exists."""
     for file_spec in skill_data.get("files", []):
         if ":" in file_spec:
             src, dst = file_spec.split(":", 1)
@@ -489,54 +2157,316 @@ def install_files_to_provider(skill_id, skill_data, provider_id):
             src = file_spec
             dst = os.path.basename(file_spec)
 
-        src_path = skill_dir / src
-        dst_path = Path(install_path) / dst
+        if SKILL_BUNDLE is not None:
+            entry = SKILL_BUNDLE.file_entry(skill_id, src)
+            if entry is not None:
+                yield dst, BundledSkillFile(SKILL_BUNDLE, entry)
+        elif (SKILLS_DIR / skill_id / src).is_file():
+            yield dst, SkillFile(SKILLS_DIR / skill_id / src)
+
+
+def sync_file(source, dst_path, mode, recorded=None):
+    """Atomically copy a source file to dst unless dst already has the same content.
+
+    recorded is (digest, installed_at) from the provider manifest and is
+    trusted when dst was not modified after installed_at. Otherwise dst is
+    hashed; provider copies never go into CHECKSUM_CACHE. A dst linked into
+    the store is always replaced, never changed in place. Returns the number
+    of bytes copied, 0 when the file was skipped.
+    """
+    dst_signature = _file_signature(dst_path)
+    if dst_signature is not None and dst_signature[0] == source.size and not _is_linked(dst_path):
+        if recorded and recorded[0] and dst_signature[1] <= recorded[1] * 1e9:
+            dst_digest = recorded[0]
+        else:
+            dst_digest = hash_file(dst_path)
+        if source.digest() == dst_digest:
+            if os.stat(dst_path).st_mode & 0o777 != mode:
+                os.chmod(dst_path, mode)
+            return 0
+
+    tmp_path = _temp_path(dst_path)
+    try:
+        source.copy_to(tmp_path)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, dst_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    METRICS.count_write(source.size)
+    return source.size
+
+
+def write_file_atomic(path, content, mode):
+    """Write text to path via temp file and rename, skipping identical content.
+
+    Returns True when the file was written.
+    """
+    path = Path(path)
+    data = content.encode()
+    try:
+        existing = path.read_bytes()
+        METRICS.count_read(len(existing))
+        if existing == data:
+            if path.stat().st_mode & 0o777 != mode:
+                os.chmod(path, mode)
+            return False
+    except OSError:
+        pass
+
+    tmp_path = _temp_path(path)
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    METRICS.count_write(len(data))
+    return True
+
+
+def store_file(source):
+    """Return the STORE_DIR path holding a source file's content, adding it if missing.
+
+    Store files are named by their sha256 and made read-only, so a write
+    through one provider's link cannot change the others.
+    """
+    path = STORE_DIR / source.digest()
+    if path.exists():
+        return path
+    STORE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = _temp_path(path)
+    try:
+        source.copy_to(tmp_path)
+        os.chmod(tmp_path, 0o555)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    METRICS.count_write(source.size)
+    return path
+
+
+def link_file(store_path, dst_path):
+    """Point dst at a store file: a hardlink, or a symlink across filesystems.
+
+    Returns True when dst changed, False when it already pointed there.
+    """
+    with contextlib.suppress(OSError):
+        if os.path.samefile(store_path, dst_path):
+            return False
+    tmp_path = _temp_path(dst_path)
+    try:
+        try:
+            os.link(store_path, tmp_path)
+        except OSError:
+            os.symlink(store_path, tmp_path)
+        os.replace(tmp_path, dst_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    return True
+
+
+def prune_store():
+    """Delete store files no linked install refers to. Returns the count."""
+    if not STORE_DIR.is_dir():
+        return 0
+    with config_snapshot():
+        roots = {info.get("path") for info in read_config().get("providers", {}).values()}
+
+    removed = 0
+    with _store_lock:
+        # Read under the lock, so every install that has linked a file has
+        # also committed it to its manifest
+        referenced = set()
+        for root in filter(None, roots):
+            for entry in read_manifest(root).values():
+                files = entry.get("files", {})
+                referenced.update(files[dst] for dst in entry.get("linked", []) if dst in files)
+
+        with os.scandir(STORE_DIR) as it:
+            for entry in it:
+                if entry.name in referenced or not entry.is_file(follow_symlinks=False):
+                    continue
+                with contextlib.suppress(OSError):
+                    # Still hardlinked from a provider the manifests do not cover
+                    if entry.stat().st_nlink > 1:
+                        continue
+                    os.remove(entry.path)
+                    removed += 1
+    return removed
+
+
+def install_files_to_provider(skill_id, skill_data, provider_id):
+    """Install skill files to a specific provider and record them in its manifest.
+
+    Only files whose content differs are copied, or in "link" install mode
+    linked from the store. Returns a report with files_copied, files_linked,
+    files_skipped and bytes_copied, or False when the provider has no
+    install path.
+    """
+    install_path = get_install_path(skill_id, provider_id)
+    if not install_path:
+        return False
 
-        if src_path.exists():
-            dst_path.write_bytes(src_path.read_bytes())
-            os.chmod(dst_path, 0o755)
+    link = get_install_mode() == "link"
+    with _store_lock if link else contextlib.nullcontext(), edit_manifest(provider_id) as manifest:
+        previous = manifest.get(skill_id)
+        report, entry = _sync_skill_files(skill_id, skill_data, install_path, link, previous or {})
+        if previous and not report["files_copied"] and all(
+            previous.get(k) == entry[k] for k in ("checksum", "files", "config_hash", "linked")
+        ):
+            entry["installed_at"] = previous.get("installed_at", entry["installed_at"])
+        manifest[skill_id] = entry
+    notify_skill_changed(skill_id, {provider_id: install_details(entry)})
+    return report
 
+
+def _sync_skill_files(skill_id, skill_data, install_path, link, previous):
+    os.makedirs(install_path, exist_ok=True)
+    report = {"files_copied": 0, "files_linked": 0, "files_skipped": 0, "bytes_copied": 0}
     checksum = compute_skill_checksum(skill_id, skill_data)
-    checksum_path = Path(install_path) / ".checksum"
-    checksum_path.write_text(checksum)
+    files = {}
+    linked_files = []
+
+    for dst, source in skill_source_files(skill_id, skill_data):
+        dst_path = Path(install_path) / dst
+        files[dst] = source.digest()
+        if link:
+            try:
+                linked = link_file(store_file(source), dst_path)
+                report["files_linked" if linked else "files_skipped"] += 1
+                linked_files.append(dst)
+                continue
+            except OSError:
+                pass  # e.g. no link support on the provider's filesystem; copy instead
+        recorded = (previous.get("files", {}).get(dst), previous.get("installed_at", 0))
+        copied = sync_file(source, dst_path, 0o755, recorded)
+        if copied:
+            report["files_copied"] += 1
+            report["bytes_copied"] += copied
+        else:
+            report["files_skipped"] += 1
+
+    # The manifest replaces the .checksum files written by older versions
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(Path(install_path) / ".checksum")
 
     # Copy central .env if exists
     central_env = get_central_config_path(skill_id) / ".env"
+    env_path = Path(install_path) / ".env"
+    env_hash = None
     if central_env.exists():
-        provider_env = Path(install_path) / ".env"
-        provider_env.write_text(central_env.read_text())
-        os.chmod(provider_env, 0o600)
+        content = central_env.read_text()
+        write_file_atomic(env_path, content, 0o600)
+        env_hash = config_hash(content)
+    elif env_path.exists():
+        env_hash = config_hash(env_path.read_text())
+
+    entry = {
+        "checksum": checksum,
+        "files": files,
+        "installed_at": time.time(),
+        "config_hash": env_hash,
+        "linked": linked_files,
+    }
+    return report, entry
 
-    return True
+
+_install_pool = LazyThreadPool(INSTALL_WORKERS, "installer-sync")
+
+
+def fan_out_providers(tasks):
+    """Run {provider_id: [callable, ...]} with providers in parallel.
+
+    Each provider's callables run in order on one worker. Returns
+    {provider_id: [result, ...]} in the same order. Callers may hold
+    _write_lock (update_repo does), so the callables must never take it
+    or every worker can end up waiting on the caller.
+    """
+    def run_in_order(calls):
+        with config_snapshot():
+            return [call() for call in calls]
+
+    futures = {pid: _install_pool.submit(run_in_order, calls) for pid, calls in tasks.items()}
+    return {pid: future.result() for pid, future in futures.items()}
 
 
 def install_files(skill_id, skill_data):
     """Install skill files to all enabled providers."""
+    providers = get_enabled_providers()
+    reports = fan_out_providers({
+        pid: [functools.partial(install_files_to_provider, skill_id, skill_data, pid)]
+        for pid in providers
+    })
     results = []
-    for provider_id in get_enabled_providers():
-        success = install_files_to_provider(skill_id, skill_data, provider_id)
-        results.append({"provider": provider_id, "success": success})
+    for provider_id in providers:
+        report = reports[provider_id][0]
+        results.append({"provider": provider_id, "success": bool(report), **(report or {})})
     return results
 
 
-def update_installed_skills():
-    """Update installed skills whose repo files changed."""
+def update_installed_skills(skill_ids=None, reinstall=False):
+    """Update installed skills whose repo files changed.
+
+    Only skills in skill_ids are considered when it is given; reinstall
+    updates every installed skill, e.g. to apply a new install mode.
+    Providers are updated in parallel. Returns a report with the number of
+    updated installations and, per skill, the providers updated and the
+    seconds spent.
+    """
+    started = time.monotonic()
+    with config_snapshot():
+        skills = SKILL_CATALOG.all()
+        providers = get_enabled_providers()
+    if skill_ids is not None:
+        skills = [s for s in skills if s["id"] in skill_ids]
+
+    def update_provider(provider_id):
+        outdated = [
+            s for s in skills
+            if installed_skill_is_outdated(s["id"], s, provider_id)
+            or (reinstall and scan_provider(provider_id).get(s["id"]) is not None)
+        ]
+        timings = []
+        for skill_data in outdated:
+            skill_started = time.monotonic()
+            if install_files_to_provider(skill_data["id"], skill_data, provider_id):
+                timings.append((skill_data["id"], time.monotonic() - skill_started))
+        return timings
+
+    results = fan_out_providers({
+        pid: [functools.partial(update_provider, pid)] for pid in providers
+    })
+
     updated = 0
-    for skill_dir in sorted(SKILLS_DIR.iterdir()):
-        skill_json = skill_dir / "skill.json"
-        if not skill_json.exists():
-            continue
+    per_skill = {}
+    for provider_id in providers:
+        for skill_id, seconds in results[provider_id][0]:
+            entry = per_skill.setdefault(skill_id, {"providers": [], "seconds": 0.0})
+            entry["providers"].append(provider_id)
+            entry["seconds"] = round(entry["seconds"] + seconds, 4)
+            updated += 1
+    if updated:
+        prune_store()
 
-        with open(skill_json) as f:
-            skill_data = json.load(f)
+    return {
+        "updated": updated,
+        "skills": per_skill,
+        "seconds": round(time.monotonic() - started, 4),
+    }
 
-        skill_id = skill_dir.name
-        for provider_id in get_enabled_providers():
-            if installed_skill_is_outdated(skill_id, skill_data, provider_id):
-                if install_files_to_provider(skill_id, skill_data, provider_id):
-                    updated += 1
 
-    return updated
+def _update_message(updated):
+    install_word = "installation" if updated == 1 else "installations"
+    return f"Updated {updated} installed skill {install_word}"
 
 
 def get_central_config_path(skill_id):
@@ -544,9 +2474,93 @@ def get_central_config_path(skill_id):
     return CONFIG_DIR / skill_id
 
 
+def env_slug(slug):
+    """Convert an item slug to its env var form (spaces, dashes, dots -> _)."""
+    return slug.upper().replace(" ", "_").replace("-", "_").replace(".", "_")
+
+
+def list_env_prefix(field):
+    """Return the env var prefix of a list field (organizations -> ORG, databases -> DB)."""
+    field_name = field.get("name", "")
+    if field_name == "organizations":
+        return "ORG"
+    if field_name == "databases":
+        return "DB"
+    return field.get("env_key", field_name.upper().rstrip("S")[:3])
+
+
+class SkillEnv:
+    """Parsed central .env of one skill.
+
+    Values keep file order and are parsed once per file change (see
+    load_cached_file); list item slugs are indexed on first use.
+    """
+
+    def __init__(self, skill_id, values=None):
+        self.skill_id = skill_id
+        self.skill_upper = skill_id.upper().replace("-", "_")
+        self.values = values if values is not None else {}
+        self._indexes = {}
+
+    @classmethod
+    def parse(cls, skill_id, text):
+        values = {}
+        for line in text.splitlines():
+            line = line.strip()
+            if "=" in line:
+                key, value = line.split("=", 1)
+                values[key] = value.strip('"').strip("'")
+        return cls(skill_id, values)
+
+    def render(self):
+        return "".join(f'{key}="{value}"\n' for key, value in self.values.items())
+
+    def list_slugs(self, list_prefix, marker):
+        """Return the upper-case slugs of one list field, keyed by marker.
+
+        An item exists when {SKILL}_{PREFIX}_{SLUG}_{MARKER} is set; the
+        result is memoized so each list field scans the keys once.
+        """
+        cache_key = (list_prefix, marker)
+        slugs = self._indexes.get(cache_key)
+        if slugs is None:
+            env_prefix = f"{self.skill_upper}_{list_prefix}_"
+            env_suffix = f"_{marker}"
+            slugs = [
+                key[len(env_prefix):-len(env_suffix)]
+                for key in self.values
+                if key.startswith(env_prefix) and key.endswith(env_suffix)
+            ]
+            self._indexes[cache_key] = slugs
+        return slugs
+
+    def item_value(self, list_prefix, slug_upper, suffix, default=None):
+        return self.values.get(f"{self.skill_upper}_{list_prefix}_{slug_upper}_{suffix}", default)
+
+
+def load_skill_env(skill_id):
+    """Return the cached SkillEnv for a skill's central .env (empty if missing)."""
+    env_path = get_central_config_path(skill_id) / ".env"
+    env = load_cached_file(env_path, lambda path: SkillEnv.parse(skill_id, path.read_text()))
+    return env if env is not None else SkillEnv(skill_id)
+
+
+def save_skill_env(skill_id, values):
+    """Write a skill's central .env in one pass and sync it to providers."""
+    env = SkillEnv(skill_id, values)
+    central_path = get_central_config_path(skill_id)
+    central_path.mkdir(parents=True, exist_ok=True)
+    env_path = central_path / ".env"
+    write_file_atomic(env_path, env.render(), 0o600)
+    store_cached_file(env_path, env)
+
+    sync_config_to_providers(skill_id)
+
+
+@serialized
 def save_skill_config(skill_id, skill_data, config):
     """Save configuration to central location and sync to installed providers."""
-    lines = []
+    values = {}
     skill_upper = skill_id.upper().replace("-", "_")
 
     for field in skill_data.get("fields", []):
@@ -557,21 +2571,13 @@ def save_skill_config(skill_id, skill_data, config):
         if field_type == "list":
             items = config.get(field_name, [])
             if isinstance(items, list):
-                # Determine the prefix based on field name
-                # organizations -> ORG, databases -> DB
-                list_prefix = field.get("env_key", field_name.upper().rstrip("S")[:3])
-                if field_name == "organizations":
-                    list_prefix = "ORG"
-                elif field_name == "databases":
-                    list_prefix = "DB"
+                list_prefix = list_env_prefix(field)
 
                 for item in items:
                     slug = item.get("slug", "")
                     if not slug:
                         continue
-                    # Replace spaces, dashes, and dots with underscores
-                    slug_upper = slug.upper().replace(" ", "_").replace("-", "_").replace(".", "_")
-                    env_prefix = f"{skill_upper}_{list_prefix}_{slug_upper}_"
+                    env_prefix = f"{skill_upper}_{list_prefix}_{env_slug(slug)}_"
 
                     # Save item_fields
                     for item_field in field.get("item_fields", []):
@@ -580,7 +2586,7 @@ def save_skill_config(skill_id, skill_data, config):
                             continue  # slug is used in naming, not stored directly
                         item_value = item.get(item_field_name, item_field.get("default", ""))
                         field_upper = item_field_name.upper().replace("-", "_")
-                        lines.append(f'{env_prefix}{field_upper}="{item_value}"')
+                        values[f"{env_prefix}{field_upper}"] = item_value
 
                     # Save OAuth tokens if field has item_oauth
                     item_oauth = field.get("item_oauth")
@@ -589,39 +2595,28 @@ def save_skill_config(skill_id, skill_data, config):
                         for token_key, env_suffix in token_mapping.items():
                             token_value = item.get(token_key, "")
                             if token_value:
-                                lines.append(f'{env_prefix}{env_suffix}="{token_value}"')
+                                values[f"{env_prefix}{env_suffix}"] = token_value
         else:
             env_var = field.get("env_var", "")
-            value = config.get(field_name, "")
             if env_var:
-                lines.append(f'{env_var}="{value}"')
+                values[env_var] = config.get(field_name, "")
 
     # Handle default field for list types (e.g., default_org, default_db)
     for field in skill_data.get("fields", []):
         if field.get("type") == "list":
-            field_name = field.get("name", "")
-            # Determine prefix (organizations -> ORG, databases -> DB)
-            list_prefix = field.get("env_key", field_name.upper().rstrip("S")[:3])
-            if field_name == "organizations":
-                list_prefix = "ORG"
-            elif field_name == "databases":
-                list_prefix = "DB"
+            default_key = f"default_{field.get('name', '').rstrip('s')}"  # organizations -> default_org
+            if config.get(default_key):
+                values[f"{skill_upper}_DEFAULT_{list_env_prefix(field)}"] = config[default_key]
 
-            default_key = f"default_{field_name.rstrip('s')}"  # organizations -> default_org, databases -> default_database
-            if default_key in config and config[default_key]:
-                lines.append(f'{skill_upper}_DEFAULT_{list_prefix}="{config[default_key]}"')
+    save_skill_env(skill_id, values)
 
-    content = "\n".join(lines) + "\n"
-
-    # Save to central location
-    central_path = get_central_config_path(skill_id)
-    central_path.mkdir(parents=True, exist_ok=True)
-    env_path = central_path / ".env"
-    env_path.write_text(content)
-    os.chmod(env_path, 0o600)
 
-    # Sync to all installed providers
-    sync_config_to_providers(skill_id)
+def _current_install(skill_id, provider_id, manifest):
+    """Install details after an edit_manifest block, rescanning only legacy installs."""
+    entry = manifest.get(skill_id)
+    if entry is not None:
+        return install_details(entry)
+    return scan_provider(provider_id).get(skill_id)
 
 
 def sync_config_to_providers(skill_id):
@@ -631,32 +2626,29 @@ def sync_config_to_providers(skill_id):
         return
 
     content = central_env.read_text()
+    env_hash = config_hash(content)
+    changed = {}
     for provider_id in get_enabled_providers():
         install_path = get_install_path(skill_id, provider_id)
-        if install_path and os.path.isdir(install_path):
-            provider_env = Path(install_path) / ".env"
-            provider_env.write_text(content)
-            os.chmod(provider_env, 0o600)
+        if not install_path or not os.path.isdir(install_path):
+            continue
+        with edit_manifest(provider_id) as manifest:
+            write_file_atomic(Path(install_path) / ".env", content, 0o600)
+            if skill_id in manifest:
+                manifest[skill_id]["config_hash"] = env_hash
+        changed[provider_id] = _current_install(skill_id, provider_id, manifest)
+
+    notify_skill_changed(skill_id, changed)
 
 
 def get_current_config(skill_id, skill_data):
     """Get current configuration values from central location."""
-    central_env = get_central_config_path(skill_id) / ".env"
-
     config = {}
-    if not central_env.exists():
+    env = load_skill_env(skill_id)
+    if not env.values:
         return config
 
-    skill_upper = skill_id.upper().replace("-", "_")
-    env_content = central_env.read_text()
-
-    # Parse all env vars
-    env_vars = {}
-    for line in env_content.splitlines():
-        line = line.strip()
-        if "=" in line:
-            key, value = line.split("=", 1)
-            env_vars[key] = value.strip('"').strip("'")
+    env_vars = env.values
 
     for field in skill_data.get("fields", []):
         field_type = field.get("type", "text")
@@ -665,71 +2657,50 @@ def get_current_config(skill_id, skill_data):
         # Handle list type fields
         if field_type == "list":
             items = []
-            # Determine the prefix based on field name (same logic as save)
-            list_prefix = field.get("env_key", field_name.upper().rstrip("S")[:3])
-            if field_name == "organizations":
-                list_prefix = "ORG"
-            elif field_name == "databases":
-                list_prefix = "DB"
-
-            env_prefix = f"{skill_upper}_{list_prefix}_"
+            list_prefix = list_env_prefix(field)
+            item_fields = [
+                (f.get("name", ""), f.get("name", "").upper().replace("-", "_"), f)
+                for f in field.get("item_fields", [])
+                if f.get("name", "") != "slug"
+            ]
 
             # For fields with item_oauth, look for REFRESH_TOKEN as marker
             item_oauth = field.get("item_oauth")
             if item_oauth:
                 token_mapping = item_oauth.get("token_mapping", {})
-                refresh_token_suffix = token_mapping.get("refresh_token", "REFRESH_TOKEN")
-                # Find all slugs by looking for env vars with REFRESH_TOKEN
-                for key in env_vars:
-                    if key.startswith(env_prefix) and key.endswith(f"_{refresh_token_suffix}"):
-                        slug_part = key[len(env_prefix):-(len(refresh_token_suffix)+1)]
-                        slug = slug_part.lower().replace("_", "-")
-                        slug_upper = slug.upper().replace("-", "_")
-
-                        item = {"slug": slug}
-                        # Get all token fields
-                        for token_key, env_suffix in token_mapping.items():
-                            env_key = f"{env_prefix}{slug_upper}_{env_suffix}"
-                            if env_key in env_vars:
-                                item[token_key] = env_vars[env_key]
-
-                        # Also get any item_fields
-                        for item_field in field.get("item_fields", []):
-                            item_field_name = item_field.get("name", "")
-                            if item_field_name == "slug":
-                                continue
-                            field_upper = item_field_name.upper().replace("-", "_")
-                            env_key = f"{env_prefix}{slug_upper}_{field_upper}"
-                            if env_key in env_vars:
-                                item[item_field_name] = env_vars[env_key]
-
-                        items.append(item)
+                marker = token_mapping.get("refresh_token", "REFRESH_TOKEN")
+                for slug_upper in env.list_slugs(list_prefix, marker):
+                    slug = slug_upper.lower().replace("_", "-")
+                    slug_upper = slug.upper().replace("-", "_")
+                    item = {"slug": slug}
+                    for token_key, env_suffix in token_mapping.items():
+                        value = env.item_value(list_prefix, slug_upper, env_suffix)
+                        if value is not None:
+                            item[token_key] = value
+                    for item_field_name, field_upper, _ in item_fields:
+                        value = env.item_value(list_prefix, slug_upper, field_upper)
+                        if value is not None:
+                            item[item_field_name] = value
+                    items.append(item)
             else:
                 # Standard list field logic
-                item_fields = field.get("item_fields", [])
-                marker_field = next((f for f in item_fields if f.get("name") != "slug" and f.get("required")), None)
-                if not marker_field and item_fields:
-                    marker_field = item_fields[1] if len(item_fields) > 1 else item_fields[0]
+                all_item_fields = field.get("item_fields", [])
+                marker_field = next((f for f in all_item_fields if f.get("name") != "slug" and f.get("required")), None)
+                if not marker_field and all_item_fields:
+                    marker_field = all_item_fields[1] if len(all_item_fields) > 1 else all_item_fields[0]
 
                 slugs = set()
                 if marker_field:
-                    marker_name = marker_field.get("name", "").upper().replace("-", "_")
-                    for key in env_vars:
-                        if key.startswith(env_prefix) and key.endswith(f"_{marker_name}"):
-                            slug_part = key[len(env_prefix):-(len(marker_name)+1)]
-                            slug = slug_part.lower().replace("_", "-")
-                            slugs.add(slug)
+                    marker = marker_field.get("name", "").upper().replace("-", "_")
+                    slugs = {s.lower().replace("_", "-") for s in env.list_slugs(list_prefix, marker)}
 
                 for slug in sorted(slugs):
                     slug_upper = slug.upper().replace("-", "_")
                     item = {"slug": slug}
-                    for item_field in field.get("item_fields", []):
-                        item_field_name = item_field.get("name", "")
-                        if item_field_name == "slug":
-                            continue
-                        field_upper = item_field_name.upper().replace("-", "_")
-                        env_key = f"{env_prefix}{slug_upper}_{field_upper}"
-                        item[item_field_name] = env_vars.get(env_key, item_field.get("default", ""))
+                    for item_field_name, field_upper, item_field in item_fields:
+                        item[item_field_name] = env.item_value(
+                            list_prefix, slug_upper, field_upper, item_field.get("default", "")
+                        )
                     items.append(item)
 
             config[field_name] = items
@@ -741,17 +2712,9 @@ def get_current_config(skill_id, skill_data):
     # Get default field for list types (e.g., default_org, default_db)
     for field in skill_data.get("fields", []):
         if field.get("type") == "list":
-            field_name = field.get("name", "")
-            # Determine prefix (organizations -> ORG, databases -> DB)
-            list_prefix = field.get("env_key", field_name.upper().rstrip("S")[:3])
-            if field_name == "organizations":
-                list_prefix = "ORG"
-            elif field_name == "databases":
-                list_prefix = "DB"
-
-            default_env_key = f"{skill_upper}_DEFAULT_{list_prefix}"
+            default_env_key = f"{env.skill_upper}_DEFAULT_{list_env_prefix(field)}"
             if default_env_key in env_vars:
-                default_config_key = f"default_{field_name.rstrip('s')}"  # DEFAULT_ORG -> default_org
+                default_config_key = f"default_{field.get('name', '').rstrip('s')}"  # DEFAULT_ORG -> default_org
                 config[default_config_key] = env_vars[default_env_key]
 
     return config
@@ -763,8 +2726,50 @@ def strip_ansi(text):
     return re.sub(r'\x1b\[[0-9;]*m', '', text)
 
 
-def test_skill(skill_id, skill_data):
-    """Run skill test command."""
+class TestResults:
+    """Last test outcome per skill, persisted to TEST_RESULTS_FILE.
+
+    Lets the UI show catalog health without re-running every test.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._results = None
+
+    def _ensure_loaded(self):
+        if self._results is not None:
+            return
+        try:
+            with open(self.path) as f:
+                self._results = json.load(f)
+        except (OSError, ValueError):
+            self._results = {}
+
+    def all(self):
+        with self._lock:
+            self._ensure_loaded()
+            return copy.deepcopy(self._results)
+
+    def record(self, skill_id, outcome):
+        entry = dict(outcome, output=outcome.get("output", "")[-TEST_OUTPUT_LIMIT:], finished_at=time.time())
+        with self._lock:
+            self._ensure_loaded()
+            self._results[skill_id] = entry
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                write_file_atomic(self.path, json.dumps(self._results), 0o600)
+            except OSError:
+                pass
+
+
+TEST_RESULTS = TestResults(TEST_RESULTS_FILE)
+_test_pool = LazyThreadPool(TEST_WORKERS, "skill-test")
+
+
+def test_skill(skill_id, skill_data, timeout=TEST_TIMEOUT, prefix=""):
+    """Run skill test command and record its outcome."""
+    import subprocess
     install_path = get_primary_install_path(skill_id)
     test_cmd = skill_data.get("test_command", "")
 
@@ -779,25 +2784,109 @@ def test_skill(skill_id, skill_data):
         return {"success": False, "output": f"Executable not found: {executable}"}
 
     cmd = f"{executable} {test_cmd}"
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    started = time.monotonic()
+    try:
+        result = run_process(cmd, shell=True, kind="test", timeout=timeout, prefix=prefix)
+    except subprocess.TimeoutExpired as e:
+        output = strip_ansi((e.stdout or "") + (e.stderr or ""))
+        outcome = {
+            "success": False,
+            "output": f"{output}\nTimed out after {timeout}s".lstrip(),
+            "timed_out": True,
+        }
+    else:
+        output = strip_ansi(result.stdout + result.stderr)
+        outcome = {
+            "success": result.returncode == 0,
+            "output": output or "(no output)"
+        }
+    outcome["duration"] = round(time.monotonic() - started, 3)
+    TEST_RESULTS.record(skill_id, outcome)
+    return outcome
+
+
+def get_testable_skills():
+    """Skills with a test command that are installed, and configured if needed,
+    in the primary provider."""
+    with config_snapshot():
+        providers = get_enabled_providers()
+        if not providers:
+            return []
+        scan = scan_provider(providers[0])
+        testable = []
+        for data in SKILL_CATALOG.all():
+            installed = scan.get(data["id"])
+            if not data.get("test_command") or installed is None:
+                continue
+            if skill_needs_config(data) and not installed["has_env"]:
+                continue
+            if os.path.isfile(os.path.join(get_install_path(data["id"], providers[0]), data["id"])):
+                testable.append(data)
+        return testable
+
+
+def run_all_tests(skill_ids=None, timeout=TEST_TIMEOUT):
+    """Test every testable skill concurrently, TEST_WORKERS at a time.
+
+    Inside a job, output lines stream into it prefixed with "[skill] ".
+    Returns pass/fail counts and, per skill, success, duration and whether
+    it timed out; full output is kept in TEST_RESULTS.
+    """
+    skills = get_testable_skills()
+    if skill_ids is not None:
+        skills = [s for s in skills if s["id"] in skill_ids]
+
+    job = current_job()
+    lock = threading.Lock()
+    done = [0]
+
+    def test_one(skill_data):
+        outcome = test_skill(skill_data["id"], skill_data, timeout, prefix=f"[{skill_data['id']}] ")
+        with lock:
+            done[0] += 1
+            finished = done[0]
+        report_progress(finished / len(skills), f"Tested {finished}/{len(skills)}")
+        return outcome
+
+    report_progress(0.0, f"Testing {len(skills)} skills")
+    futures = {s["id"]: _test_pool.submit(run_in_job, job, test_one, s) for s in skills}
+    results = {}
+    for skill_id, future in futures.items():
+        outcome = future.result()
+        results[skill_id] = {
+            "success": outcome["success"],
+            "duration": outcome.get("duration"),
+            "timed_out": outcome.get("timed_out", False),
+        }
 
-    output = strip_ansi(result.stdout + result.stderr)
+    failed = sum(1 for r in results.values() if not r["success"])
     return {
-        "success": result.returncode == 0,
-        "output": output or "(no output)"
+        "success": failed == 0,
+        "passed": len(results) - failed,
+        "failed": failed,
+        "results": results,
     }
 
 
+@serialized
 def clear_auth(skill_id, skill_data):
     """Remove credentials from all providers."""
     removed = False
+    changed = {}
     for provider_id in get_enabled_providers():
         install_path = get_install_path(skill_id, provider_id)
-        if install_path:
-            env_path = os.path.join(install_path, ".env")
+        if not install_path or not os.path.isdir(install_path):
+            continue
+        env_path = os.path.join(install_path, ".env")
+        with edit_manifest(provider_id) as manifest:
             if os.path.isfile(env_path):
                 os.remove(env_path)
                 removed = True
+            if skill_id in manifest:
+                manifest[skill_id]["config_hash"] = None
+        changed[provider_id] = _current_install(skill_id, provider_id, manifest)
+    if removed:
+        notify_skill_changed(skill_id, changed)
     return removed
 
 
@@ -813,18 +2902,19 @@ def run_oauth_flow(skill_id, skill_data, client_id, client_secret):
     return result
 
 
+@serialized
 def save_oauth_tokens(skill_id, skill_data, tokens, client_id, client_secret):
     """Save OAuth tokens to skill config."""
     # Build env content from fields + tokens
-    lines = []
+    values = {}
 
     # Add client credentials
     for field in skill_data.get("fields", []):
         env_var = field.get("env_var", "")
         if "CLIENT_ID" in env_var:
-            lines.append(f'{env_var}="{client_id}"')
+            values[env_var] = client_id
         elif "CLIENT_SECRET" in env_var:
-            lines.append(f'{env_var}="{client_secret}"')
+            values[env_var] = client_secret
 
     # Add tokens
     oauth_config = skill_data.get("oauth", {})
@@ -837,26 +2927,14 @@ def save_oauth_tokens(skill_id, skill_data, tokens, client_id, client_secret):
     prefix = skill_id.upper()
     for token_key, env_suffix in token_mapping.items():
         if token_key in tokens:
-            value = tokens[token_key]
-            lines.append(f'{prefix}_{env_suffix}="{value}"')
+            values[f"{prefix}_{env_suffix}"] = tokens[token_key]
 
     # Add any extra fields from token response
     for key, value in tokens.items():
         if key not in token_mapping and value and isinstance(value, (str, int)):
-            env_key = f"{prefix}_{key.upper()}"
-            lines.append(f'{env_key}="{value}"')
-
-    content = "\n".join(lines) + "\n"
-
-    # Save to central location
-    central_path = get_central_config_path(skill_id)
-    central_path.mkdir(parents=True, exist_ok=True)
-    env_path = central_path / ".env"
-    env_path.write_text(content)
-    os.chmod(env_path, 0o600)
+            values[f"{prefix}_{key.upper()}"] = value
 
-    # Sync to providers
-    sync_config_to_providers(skill_id)
+    save_skill_env(skill_id, values)
 
 
 def run_oauth_flow_for_account(skill_id, skill_data, field, account_slug, client_id, client_secret):
@@ -871,36 +2949,29 @@ def run_oauth_flow_for_account(skill_id, skill_data, field, account_slug, client
     return result
 
 
+@serialized
 def save_account_oauth_tokens(skill_id, skill_data, field, account_slug, tokens, client_id, client_secret):
     """Save OAuth tokens for a specific account."""
-    central_path = get_central_config_path(skill_id)
-    central_path.mkdir(parents=True, exist_ok=True)
-    env_path = central_path / ".env"
-
-    # Read existing content
-    existing_lines = []
-    if env_path.exists():
-        existing_lines = env_path.read_text().splitlines()
+    env = load_skill_env(skill_id)
 
     # Build prefix for this account
-    skill_upper = skill_id.upper().replace("-", "_")
     env_key = field.get("env_key", "ACCOUNT")
-    slug_upper = account_slug.upper().replace(" ", "_").replace("-", "_").replace(".", "_")
-    account_prefix = f"{skill_upper}_{env_key}_{slug_upper}_"
-
-    # Remove old tokens for this account
-    new_lines = [line for line in existing_lines if not line.startswith(account_prefix)]
+    account_prefix = f"{env.skill_upper}_{env_key}_{env_slug(account_slug)}_"
 
-    # Ensure client credentials are present
-    has_client_id = any("CLIENT_ID=" in line for line in new_lines)
-    has_client_secret = any("CLIENT_SECRET=" in line for line in new_lines)
+    # Drop old tokens for this account
+    existing = {k: v for k, v in env.values.items() if not k.startswith(account_prefix)}
 
+    # Ensure client credentials are present, ahead of everything else
+    values = {}
+    has_client_id = any("CLIENT_ID" in key for key in existing)
+    has_client_secret = any("CLIENT_SECRET" in key for key in existing)
     for f in skill_data.get("fields", []):
         env_var = f.get("env_var", "")
         if "CLIENT_ID" in env_var and not has_client_id:
-            new_lines.insert(0, f'{env_var}="{client_id}"')
+            values[env_var] = client_id
         elif "CLIENT_SECRET" in env_var and not has_client_secret:
-            new_lines.insert(1, f'{env_var}="{client_secret}"')
+            values[env_var] = client_secret
+    values.update(existing)
 
     # Add new tokens for this account
     item_oauth = field.get("item_oauth", {})
@@ -912,54 +2983,366 @@ def save_account_oauth_tokens(skill_id, skill_data, field, account_slug, tokens,
 
     for token_key, env_suffix in token_mapping.items():
         if token_key in tokens:
-            value = tokens[token_key]
-            new_lines.append(f'{account_prefix}{env_suffix}="{value}"')
+            values[f"{account_prefix}{env_suffix}"] = tokens[token_key]
 
-    # Write back
-    content = "\n".join(new_lines) + "\n"
-    env_path.write_text(content)
-    os.chmod(env_path, 0o600)
+    save_skill_env(skill_id, values)
 
-    # Sync to providers
-    sync_config_to_providers(skill_id)
+
+def _remove_installation(skill_id, provider_id):
+    """Drop a skill from a provider's manifest, then delete its directory.
+
+    The manifest is committed first, so an interrupted delete leaves a
+    directory that reads as outdated rather than as a healthy install.
+    """
+    install_path = get_install_path(skill_id, provider_id)
+    with provider_lock(provider_id):
+        if not install_path or not os.path.isdir(install_path):
+            return False
+        with edit_manifest(provider_id) as manifest:
+            manifest.pop(skill_id, None)
+        shutil.rmtree(install_path)
+    return True
 
 
+@serialized
 def uninstall_skill(skill_id, skill_data):
     """Remove skill from all providers."""
-    import shutil
-    removed = False
+    removed = {}
     for provider_id in get_enabled_providers():
-        install_path = get_install_path(skill_id, provider_id)
-        if install_path and os.path.isdir(install_path):
-            shutil.rmtree(install_path)
-            removed = True
-    return removed
+        if _remove_installation(skill_id, provider_id):
+            removed[provider_id] = None
+    if removed:
+        prune_store()
+        notify_skill_changed(skill_id, removed)
+    return bool(removed)
 
 
 def uninstall_skill_from_provider(skill_id, provider_id):
-    """Remove skill from a specific provider."""
-    import shutil
-    install_path = get_install_path(skill_id, provider_id)
-    if install_path and os.path.isdir(install_path):
-        shutil.rmtree(install_path)
-        return True
-    return False
+    """Remove skill from a specific provider.
+
+    Only the provider's lock is taken, so this is safe to run as a
+    fan_out_providers task.
+    """
+    if not _remove_installation(skill_id, provider_id):
+        return False
+    prune_store()
+    notify_skill_changed(skill_id, {provider_id: None})
+    return True
+
+
+def install_dependencies_action(skill):
+    """Install dependencies and return (payload, http_status)."""
+    result = install_dependencies(skill)
+    return result, 200 if result.get("success") else 400
+
+
+def update_action():
+    """Update the repo and installed skills and return (payload, http_status)."""
+    return update_repo(), 200
+
+
+def test_action(skill_id, skill):
+    """Run a skill's test and return (payload, http_status)."""
+    return test_skill(skill_id, skill), 200
+
+
+def install_mode_action(mode):
+    """Switch install mode, re-sync installed skills and return (payload, http_status)."""
+    set_install_mode(mode)
+    report = update_installed_skills(reinstall=True)
+    return {"success": True, "install_mode": mode, **report}, 200
+
+
+def get_settings():
+    """Installer-wide settings shown in the UI."""
+    store_files = store_bytes = 0
+    with contextlib.suppress(OSError), os.scandir(STORE_DIR) as it:
+        for entry in it:
+            store_files += 1
+            store_bytes += entry.stat(follow_symlinks=False).st_size
+    return {"install_mode": get_install_mode(), "store": {"files": store_files, "bytes": store_bytes}}
+
+
+def test_all_action(skill_ids, timeout):
+    """Run every testable skill's test and return (payload, http_status)."""
+    return run_all_tests(skill_ids, timeout), 200
+
+
+BULK_ACTIONS = ("install", "update", "uninstall")
+
+
+def run_bulk_operations(operations):
+    """Run (skill, provider, action) operations and return per-item results.
+
+    An operation without a provider applies to every enabled provider.
+    Operations on the same provider run in the given order; different
+    providers run in parallel.
+    """
+    with config_snapshot():
+        enabled = get_enabled_providers()
+        skills = {}
+        results = []
+        tasks = {}
+
+        for op in operations:
+            skill_id = op.get("skill", "") if isinstance(op, dict) else ""
+            action = op.get("action", "install") if isinstance(op, dict) else ""
+            provider = op.get("provider") if isinstance(op, dict) else None
+            item = {"skill": skill_id, "provider": provider, "action": action}
+            results.append(item)
+
+            if not isinstance(op, dict):
+                item.update(success=False, error="Operation must be an object")
+                continue
+            if not (isinstance(skill_id, str) and isinstance(action, str)
+                    and (provider is None or isinstance(provider, str))):
+                item.update(success=False, error="skill, provider and action must be strings")
+                continue
+            if action not in BULK_ACTIONS:
+                item.update(success=False, error=f"Unknown action: {action}")
+                continue
+            if skill_id not in skills:
+                skills[skill_id] = SKILL_CATALOG.get(skill_id) if skill_id else None
+            skill = skills[skill_id]
+            if not skill:
+                item.update(success=False, error="Skill not found")
+                continue
+            providers = [provider] if provider else enabled
+            if not providers:
+                item.update(success=False, error="No providers configured")
+                continue
+
+            item["results"] = [None] * len(providers)
+            for position, provider_id in enumerate(providers):
+                tasks.setdefault(provider_id, []).append(
+                    functools.partial(_bulk_step, item, position, provider_id, skill, action)
+                )
+
+    fan_out_providers(tasks)
+
+    for item in results:
+        if "results" in item:
+            steps = item.pop("results")
+            if item["provider"]:
+                item.update(steps[0])
+            else:
+                item["providers"] = steps
+                item["success"] = all(step["success"] for step in steps)
+    return results
+
+
+def _bulk_step(item, position, provider_id, skill, action):
+    skill_id = skill["id"]
+    step = {"provider": provider_id}
+    try:
+        if action == "uninstall":
+            step["success"] = True
+            step["removed"] = uninstall_skill_from_provider(skill_id, provider_id)
+        else:
+            report = install_files_to_provider(skill_id, skill, provider_id)
+            step["success"] = bool(report)
+            if report:
+                step.update(report)
+            else:
+                step["error"] = "Failed to install"
+    except Exception as e:
+        step.update(success=False, error=str(e))
+    item["results"][position] = step
+
+
+def bulk_action(operations):
+    """Run bulk operations and return (payload, http_status)."""
+    results = run_bulk_operations(operations)
+    return {"success": all(r.get("success") for r in results), "results": results}, 200
+
+
+def ensure_installed(skill_id, skill):
+    """Install skill files if the primary provider does not have them yet."""
+    primary_path = get_primary_install_path(skill_id)
+    if not primary_path or not os.path.isdir(primary_path):
+        install_files(skill_id, skill)
+
+
+def oauth_action(skill_id, skill, client_id, client_secret):
+    """Run the skill OAuth flow, save tokens and return (payload, http_status)."""
+    ensure_installed(skill_id, skill)
+
+    result = run_oauth_flow(skill_id, skill, client_id, client_secret)
+    if "error" in result:
+        return {"error": result["error"]}, 400
+
+    save_oauth_tokens(skill_id, skill, result, client_id, client_secret)
+    return {"success": True, "message": "OAuth authorization complete"}, 200
+
+
+def account_oauth_action(skill_id, skill, field, account_slug, client_id, client_secret):
+    """Run OAuth for one list account, save its tokens and return (payload, http_status)."""
+    ensure_installed(skill_id, skill)
+
+    result = run_oauth_flow_for_account(skill_id, skill, field, account_slug, client_id, client_secret)
+    if "error" in result:
+        return {"error": result["error"]}, 400
+
+    save_account_oauth_tokens(skill_id, skill, field, account_slug, result, client_id, client_secret)
+    return {"success": True, "message": f"Account '{account_slug}' authorized"}, 200
+
+
+def _parse_template(path):
+    import hashlib
+    body = path.read_bytes()
+    return {
+        "body": body,
+        "gzip": gzip.compress(body),
+        "etag": '"' + hashlib.sha256(body).hexdigest()[:32] + '"',
+    }
+
+
+def query_list(query, name):
+    """Return a comma-separated query parameter as a list, or None if absent."""
+    if name not in query:
+        return None
+    return [item.strip() for value in query[name] for item in value.split(",") if item.strip()]
 
 
 class RequestHandler(http.server.BaseHTTPRequestHandler):
     """HTTP request handler for the installer."""
 
+    protocol_version = "HTTP/1.1"
+    timeout = KEEPALIVE_TIMEOUT
+    # Headers and body go out in separate writes; without TCP_NODELAY a
+    # reused connection stalls each response on the peer's delayed ACK.
+    disable_nagle_algorithm = True
+
     def log_message(self, format, *args):
         """Suppress default logging."""
         pass
 
+    def handle_one_request(self):
+        """Serve one request against a consistent config snapshot."""
+        self._started = None
+        self._status = 0
+        self._profiler = None
+        self._profile_id = None
+        try:
+            with config_snapshot():
+                super().handle_one_request()
+        finally:
+            self._finish_metrics()
+
+    def parse_request(self):
+        """Start timing once the request line has arrived."""
+        self._started = time.perf_counter()
+        if not super().parse_request():
+            return False
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+        if self.headers.get("X-Profile") == "1" or query.get("profile") == ["1"]:
+            self._start_profile()
+        return True
+
+    def _start_profile(self):
+        """Profile this request with cProfile (handler thread only)."""
+        if not _profile_lock.acquire(blocking=False):
+            return
+        import cProfile
+        self._profiler = cProfile.Profile()
+        self._profile_id = os.urandom(6).hex()
+        METRICS.begin_profile(self._profile_id)
+        self._profiler.enable()
+
+    def _finish_metrics(self):
+        if self._started is None or not getattr(self, "command", None):
+            return
+        seconds = time.perf_counter() - self._started
+        route = route_template(self.command, self.path)
+        METRICS.record_request(route, self._status, seconds)
+
+        if self._profiler is not None:
+            self._profiler.disable()
+            _profile_lock.release()
+            import io
+            import pstats
+            stream = io.StringIO()
+            stats = pstats.Stats(self._profiler, stream=stream)
+            stats.sort_stats("cumulative").print_stats(PROFILE_STAT_LINES)
+            METRICS.finish_profile(self._profile_id, route, seconds, stream.getvalue())
+            self._profiler = None
+
+    def send_response(self, code, message=None):
+        self._status = code
+        super().send_response(code, message)
+
+    def end_headers(self):
+        if self._profile_id is not None:
+            self.send_header("X-Profile-Id", self._profile_id)
+        super().end_headers()
+
     def send_json(self, data, status=200):
         """Send JSON response."""
+        self.send_body(json.dumps(data).encode(), "application/json", status)
+
+    def accepts_gzip(self):
+        return "gzip" in self.headers.get("Accept-Encoding", "")
+
+    def send_body(self, body, content_type, status=200, etag=None, gzipped=None):
+        """Send a response with validators, optional gzip and a Content-Length.
+
+        Successful GET responses carry a strong ETag and answer 304 when the
+        client already has the same representation.
+        """
+        cacheable = self.command == "GET" and status == 200
+        if cacheable and etag is None:
+            import hashlib
+            etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+        encoding = None
+        if self.accepts_gzip() and (gzipped is not None or len(body) >= GZIP_MIN_SIZE):
+            body = gzipped if gzipped is not None else gzip.compress(body)
+            encoding = "gzip"
+            if etag:
+                etag = etag[:-1] + '-gzip"'
+
+        if cacheable and etag in self._if_none_match():
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Vary", "Accept-Encoding")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
         self.send_response(status)
-        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Type", content_type)
         self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Vary", "Accept-Encoding")
+        if cacheable:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _if_none_match(self):
+        header = self.headers.get("If-None-Match", "")
+        return {tag.strip() for tag in header.split(",") if tag.strip()}
+
+    def wants_job(self):
+        """Return true when the client asked for a background job."""
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+        if query.get("async", [""])[0] in ("1", "true"):
+            return True
+        return "respond-async" in self.headers.get("Prefer", "")
+
+    def run_action(self, kind, action, *args, skill_id=None):
+        """Run an action inline, or queue it as a job and answer 202."""
+        if self.wants_job():
+            job = JOBS.submit(kind, action, *args, skill_id=skill_id)
+            self.send_json(job.to_dict(), 202)
+            return
+        payload, status = action(*args)
+        self.send_json(payload, status)
 
     def do_OPTIONS(self):
         """Handle CORS preflight."""
@@ -967,6 +3350,7 @@ class RequestHandler(http.server.BaseHTTPRequestHandler):
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "GET, POST, DELETE, OPTIONS")
         self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.send_header("Content-Length", "0")
         self.end_headers()
 
     def do_DELETE(self):
@@ -986,6 +3370,16 @@ class RequestHandler(http.server.BaseHTTPRequestHandler):
             self.send_json({"success": True, "message": "Provider removed"})
             return
 
+        # Cancel job: DELETE /api/jobs/{id}
+        if path.startswith("/api/jobs/") and path.count("/") == 3:
+            job = JOBS.get(path.split("/")[3])
+            if not job:
+                self.send_json({"error": "Job not found"}, 404)
+                return
+            job.cancel()
+            self.send_json(job.to_dict())
+            return
+
         self.send_error(404)
 
     def do_GET(self):
@@ -995,25 +3389,68 @@ class RequestHandler(http.server.BaseHTTPRequestHandler):
 
         if path == "/" or path == "/index.html":
             self.serve_html()
+        elif path == "/api/health":
+            self.send_json({"status": "ok", "warm": _prewarmed.is_set()})
         elif path == "/api/providers":
             self.send_json(get_providers_status())
         elif path == "/api/skills":
-            self.send_json(get_skills())
+            query = urllib.parse.parse_qs(parsed.query)
+            provider = query.get("provider", [None])[0] or None
+            if provider is not None and provider not in get_enabled_providers():
+                self.send_json({"error": "Unknown provider"}, 400)
+                return
+            self.send_json(get_skills(
+                fields=query_list(query, "fields"),
+                ids=query_list(query, "ids"),
+                provider=provider,
+            ))
         elif path == "/api/check-updates":
-            self.send_json(check_for_updates())
+            refresh = urllib.parse.parse_qs(parsed.query).get("refresh", [""])[0] == "1"
+            self.send_json(check_for_updates(refresh))
+        elif path == "/api/dependencies":
+            self.send_json(check_all_dependencies())
+        elif path == "/api/events":
+            self.stream_events()
+        elif path == "/api/metrics":
+            self.send_json(METRICS.snapshot())
+        elif path.startswith("/api/metrics/profiles/"):
+            profile = METRICS.get_profile(path.split("/")[4])
+            if profile:
+                self.send_body(profile["summary"].encode(), "text/plain; charset=utf-8")
+            else:
+                self.send_json({"error": "Profile not found"}, 404)
+        elif path == "/api/jobs":
+            self.send_json([job.to_dict() for job in JOBS.list()])
+        elif path == "/api/tests":
+            self.send_json(TEST_RESULTS.all())
+        elif path == "/api/settings":
+            self.send_json(get_settings())
+        elif path.startswith("/api/jobs/"):
+            job = JOBS.get(path.split("/")[3])
+            if job:
+                query = urllib.parse.parse_qs(parsed.query)
+                try:
+                    offset = int(query.get("offset", ["0"])[0] or 0)
+                except ValueError:
+                    offset = -1
+                if offset < 0:
+                    self.send_json({"error": "offset must be a non-negative integer"}, 400)
+                    return
+                self.send_json(job.to_dict(output_offset=offset))
+            else:
+                self.send_json({"error": "Job not found"}, 404)
         elif path.startswith("/api/skills/") and path.endswith("/dependencies"):
             skill_id = path.split("/")[3]
-            skills = {s["id"]: s for s in get_skills()}
-            if skill_id in skills:
-                result = check_dependencies(skills[skill_id])
+            skill = SKILL_CATALOG.get(skill_id)
+            if skill:
+                result = check_dependencies(skill)
                 self.send_json(result)
             else:
                 self.send_json({"error": "Skill not found"}, 404)
         elif path.startswith("/api/skills/"):
             skill_id = path.split("/")[3]
-            skills = {s["id"]: s for s in get_skills()}
-            if skill_id in skills:
-                skill = skills[skill_id]
+            skill = get_skill(skill_id)
+            if skill:
                 skill["config"] = get_current_config(skill_id, skill)
                 skill["dependencies_status"] = check_dependencies(skill)
                 self.send_json(skill)
@@ -1091,20 +3528,52 @@ class RequestHandler(http.server.BaseHTTPRequestHandler):
             return
 
         if path == "/api/update":
-            result = update_repo()
-            self.send_json(result)
+            self.run_action("update", update_action)
             return
 
-        skills = {s["id"]: s for s in get_skills()}
+        if path == "/api/settings":
+            mode = data.get("install_mode")
+            if mode not in INSTALL_MODES:
+                self.send_json({"error": f"install_mode must be one of {', '.join(INSTALL_MODES)}"}, 400)
+                return
+            self.run_action("install-mode", install_mode_action, mode)
+            return
+
+        if path.startswith("/api/jobs/") and path.endswith("/cancel"):
+            job = JOBS.get(path.split("/")[3])
+            if not job:
+                self.send_json({"error": "Job not found"}, 404)
+                return
+            job.cancel()
+            self.send_json(job.to_dict())
+            return
+
+        if path == "/api/skills/test-all":
+            skill_ids = data.get("skills")
+            timeout = data.get("timeout", TEST_TIMEOUT)
+            if skill_ids is not None and not isinstance(skill_ids, list):
+                self.send_json({"error": "skills must be a list"}, 400)
+                return
+            if not isinstance(timeout, (int, float)) or timeout <= 0:
+                self.send_json({"error": "timeout must be a positive number"}, 400)
+                return
+            self.run_action("test-all", test_all_action, skill_ids, timeout)
+            return
+
+        if path == "/api/skills/bulk":
+            operations = data.get("operations")
+            if not isinstance(operations, list):
+                self.send_json({"error": "operations must be a list"}, 400)
+                return
+            self.run_action("bulk", bulk_action, operations)
+            return
+
+        skill_id = path.split("/")[3] if path.startswith("/api/skills/") else ""
+        skill = SKILL_CATALOG.get(skill_id) if skill_id else None
 
         if path.startswith("/api/skills/") and path.endswith("/dependencies/install"):
-            skill_id = path.split("/")[3]
-            if skill_id in skills:
-                result = install_dependencies(skills[skill_id])
-                if result.get("success"):
-                    self.send_json(result)
-                    return
-                self.send_json(result, 400)
+            if skill:
+                self.run_action("dependencies", install_dependencies_action, skill, skill_id=skill_id)
                 return
             self.send_json({"error": "Skill not found"}, 404)
             return
@@ -1112,12 +3581,11 @@ class RequestHandler(http.server.BaseHTTPRequestHandler):
         if path.startswith("/api/skills/") and "/install/" in path:
             # Install to specific provider: /api/skills/{id}/install/{provider}
             parts = path.split("/")
-            skill_id = parts[3]
             provider_id = parts[5]
-            if skill_id in skills:
-                success = install_files_to_provider(skill_id, skills[skill_id], provider_id)
-                if success:
-                    self.send_json({"success": True, "message": "Installed"})
+            if skill:
+                report = install_files_to_provider(skill_id, skill, provider_id)
+                if report:
+                    self.send_json({"success": True, "message": "Installed", **report})
                     return
                 self.send_json({"error": "Failed to install"}, 400)
                 return
@@ -1127,9 +3595,8 @@ class RequestHandler(http.server.BaseHTTPRequestHandler):
         if path.startswith("/api/skills/") and "/uninstall/" in path:
             # Uninstall from specific provider: /api/skills/{id}/uninstall/{provider}
             parts = path.split("/")
-            skill_id = parts[3]
             provider_id = parts[5]
-            if skill_id in skills:
+            if skill:
                 uninstall_skill_from_provider(skill_id, provider_id)
                 self.send_json({"success": True, "message": "Removed"})
                 return
@@ -1137,47 +3604,38 @@ class RequestHandler(http.server.BaseHTTPRequestHandler):
             return
 
         if path.startswith("/api/skills/") and path.endswith("/install"):
-            skill_id = path.split("/")[3]
-            if skill_id in skills:
+            if skill:
                 if not get_enabled_providers():
                     self.send_json({"error": "No providers configured"}, 400)
                     return
-                results = install_files(skill_id, skills[skill_id])
+                results = install_files(skill_id, skill)
                 self.send_json({"success": True, "message": "Installed", "results": results})
             else:
                 self.send_json({"error": "Skill not found"}, 404)
 
         elif path.startswith("/api/skills/") and path.endswith("/configure"):
-            skill_id = path.split("/")[3]
-            if skill_id in skills:
-                skill = skills[skill_id]
+            if skill:
                 if not get_enabled_providers():
                     self.send_json({"error": "No providers configured"}, 400)
                     return
                 # Install if not already installed
-                primary_path = get_primary_install_path(skill_id)
-                if not primary_path or not os.path.isdir(primary_path):
-                    install_files(skill_id, skill)
+                ensure_installed(skill_id, skill)
                 save_skill_config(skill_id, skill, data)
                 self.send_json({"success": True, "message": "Configured"})
             else:
                 self.send_json({"error": "Skill not found"}, 404)
 
         elif path.startswith("/api/skills/") and path.endswith("/test"):
-            skill_id = path.split("/")[3]
-            if skill_id in skills:
-                result = test_skill(skill_id, skills[skill_id])
-                self.send_json(result)
+            if skill:
+                self.run_action("test", test_action, skill_id, skill, skill_id=skill_id)
             else:
                 self.send_json({"error": "Skill not found"}, 404)
 
         elif path.startswith("/api/skills/") and path.endswith("/oauth"):
-            skill_id = path.split("/")[3]
-            if skill_id not in skills:
+            if not skill:
                 self.send_json({"error": "Skill not found"}, 404)
                 return
 
-            skill = skills[skill_id]
             if not skill.get("oauth"):
                 self.send_json({"error": "Skill does not support OAuth"}, 400)
                 return
@@ -1188,34 +3646,18 @@ class RequestHandler(http.server.BaseHTTPRequestHandler):
                 self.send_json({"error": "client_id and client_secret required"}, 400)
                 return
 
-            # Install files first if needed
             if not get_enabled_providers():
                 self.send_json({"error": "No providers configured"}, 400)
                 return
 
-            primary_path = get_primary_install_path(skill_id)
-            if not primary_path or not os.path.isdir(primary_path):
-                install_files(skill_id, skill)
-
-            # Run OAuth flow
-            result = run_oauth_flow(skill_id, skill, client_id, client_secret)
-
-            if "error" in result:
-                self.send_json({"error": result["error"]}, 400)
-                return
-
-            # Save tokens
-            save_oauth_tokens(skill_id, skill, result, client_id, client_secret)
-            self.send_json({"success": True, "message": "OAuth authorization complete"})
+            self.run_action("oauth", oauth_action, skill_id, skill, client_id, client_secret, skill_id=skill_id)
 
         elif path.startswith("/api/skills/") and path.endswith("/oauth-account"):
             # OAuth for a specific account in a list field with item_oauth
-            skill_id = path.split("/")[3]
-            if skill_id not in skills:
+            if not skill:
                 self.send_json({"error": "Skill not found"}, 404)
                 return
 
-            skill = skills[skill_id]
             account_slug = data.get("account")
             field_name = data.get("field", "accounts")
             client_id = data.get("client_id")
@@ -1240,49 +3682,36 @@ class RequestHandler(http.server.BaseHTTPRequestHandler):
                 self.send_json({"error": f"Field '{field_name}' does not support per-account OAuth"}, 400)
                 return
 
-            # Install files first if needed
             if not get_enabled_providers():
                 self.send_json({"error": "No providers configured"}, 400)
                 return
 
-            primary_path = get_primary_install_path(skill_id)
-            if not primary_path or not os.path.isdir(primary_path):
-                install_files(skill_id, skill)
-
-            # Run OAuth flow
-            result = run_oauth_flow_for_account(skill_id, skill, field, account_slug, client_id, client_secret)
-
-            if "error" in result:
-                self.send_json({"error": result["error"]}, 400)
-                return
-
-            # Save tokens for this account
-            save_account_oauth_tokens(skill_id, skill, field, account_slug, result, client_id, client_secret)
-            self.send_json({"success": True, "message": f"Account '{account_slug}' authorized"})
+            self.run_action(
+                "oauth-account", account_oauth_action,
+                skill_id, skill, field, account_slug, client_id, client_secret,
+                skill_id=skill_id,
+            )
 
         elif path.startswith("/api/skills/") and path.endswith("/clear-auth"):
-            skill_id = path.split("/")[3]
-            if skill_id in skills:
-                clear_auth(skill_id, skills[skill_id])
+            if skill:
+                clear_auth(skill_id, skill)
                 self.send_json({"success": True, "message": "Credentials removed"})
             else:
                 self.send_json({"error": "Skill not found"}, 404)
 
         elif path.startswith("/api/skills/") and path.endswith("/uninstall"):
-            skill_id = path.split("/")[3]
-            if skill_id in skills:
-                uninstall_skill(skill_id, skills[skill_id])
+            if skill:
+                uninstall_skill(skill_id, skill)
                 self.send_json({"success": True, "message": "Uninstalled"})
             else:
                 self.send_json({"error": "Skill not found"}, 404)
 
         elif path.startswith("/api/skills/") and path.endswith("/update"):
-            skill_id = path.split("/")[3]
-            if skill_id in skills:
+            if skill:
                 if not get_enabled_providers():
                     self.send_json({"error": "No providers configured"}, 400)
                     return
-                install_files(skill_id, skills[skill_id])
+                install_files(skill_id, skill)
                 self.send_json({"success": True, "message": "Updated"})
             else:
                 self.send_json({"error": "Skill not found"}, 404)
@@ -1290,36 +3719,138 @@ class RequestHandler(http.server.BaseHTTPRequestHandler):
         else:
             self.send_error(404)
 
+    def stream_events(self):
+        """Stream status changes to the client as Server-Sent Events."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        events = EVENTS.subscribe()
+        try:
+            self.wfile.write(b"retry: 3000\n\n")
+            self.wfile.flush()
+            while True:
+                try:
+                    event, data = events.get(timeout=EVENT_KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    self.wfile.write(b": keepalive\n\n")
+                else:
+                    self.wfile.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode())
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            EVENTS.unsubscribe(events)
+
     def serve_html(self):
         """Serve the main HTML page."""
         html_path = TEMPLATES_DIR / "index.html"
-        if html_path.exists():
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html")
-            self.end_headers()
-            self.wfile.write(html_path.read_bytes())
+        template = load_cached_file(html_path, _parse_template)
+        if template:
+            self.send_body(
+                template["body"], "text/html; charset=utf-8",
+                etag=template["etag"], gzipped=template["gzip"],
+            )
         else:
             self.send_error(404, "Template not found")
 
 
+class InstallerServer(http.server.ThreadingHTTPServer):
+    """Serve each request on its own thread so slow endpoints don't block others."""
+    daemon_threads = True
+
+
+def run_command(argv):
+    """Run a headless command for cli.sh and print its result as JSON.
+
+    Returns the exit code, or None when argv is not a command:
+      --status-json [skill ...]               statuses (get_status_report)
+      --install-files <skill> [provider ...]  copy files, default all enabled
+      --update-installed                      update_installed_skills()
+      --uninstall <skill> [provider ...]      remove, default all enabled
+      --sync-config <skill>                   copy central .env to providers
+      --build-bundle <out> [skills_dir]       pack skills for SKILLS_BUNDLE
+    """
+    commands = (
+        "--status-json", "--install-files", "--update-installed",
+        "--uninstall", "--sync-config", "--build-bundle",
+    )
+    if not argv or argv[0] not in commands:
+        return None
+
+    command, rest = argv[0], argv[1:]
+    if command == "--status-json":
+        result = get_status_report(rest or None)
+    elif command == "--install-files":
+        skill = SKILL_CATALOG.get(rest[0]) if rest else None
+        if skill is None:
+            result = {"success": False, "error": "Skill not found"}
+        else:
+            providers = rest[1:] or get_enabled_providers()
+            reports = {pid: install_files_to_provider(skill["id"], skill, pid) for pid in providers}
+            result = {"success": all(reports.values()), "providers": reports}
+    elif command == "--update-installed":
+        result = update_installed_skills()
+    elif command == "--build-bundle":
+        if not rest:
+            result = {"success": False, "error": "Output path required"}
+        else:
+            count = build_skill_bundle(rest[1] if len(rest) > 1 else SKILLS_DIR, rest[0])
+            result = {"success": True, "skills": count, "path": rest[0]}
+    elif not rest or SKILL_CATALOG.get(rest[0]) is None:
+        result = {"success": False, "error": "Skill not found"}
+    elif command == "--uninstall":
+        providers = rest[1:] or get_enabled_providers()
+        removed = {pid: uninstall_skill_from_provider(rest[0], pid) for pid in providers}
+        result = {"success": True, "providers": removed}
+    else:
+        sync_config_to_providers(rest[0])
+        result = {"success": True}
+
+    print(json.dumps(result))
+    return 1 if result.get("success") is False else 0
+
+
 def main():
+    exit_code = run_command(sys.argv[1:])
+    if exit_code is not None:
+        CHECKSUM_CACHE.flush()
+        sys.exit(exit_code)
+
     no_browser = "--no-browser" in sys.argv
     args = [a for a in sys.argv[1:] if a != "--no-browser"]
     port = int(args[0]) if args else 8765
 
     try:
-        server = http.server.HTTPServer(("localhost", port), RequestHandler)
+        server = InstallerServer(("localhost", port), RequestHandler)
     except OSError:
-        server = http.server.HTTPServer(("localhost", 0), RequestHandler)
-        port = server.server_address[1]
+        server = InstallerServer(("localhost", 0), RequestHandler)
+    port = server.server_address[1]
 
     url = f"http://localhost:{port}"
     print(f"Server running at {url}")
+    # Machine-readable handshake for the desktop shell; the socket is already listening
+    print(f"READY {url}", flush=True)
+
+    threading.Thread(target=prewarm, name="prewarm", daemon=True).start()
+
+    if not BUNDLED_MODE:
+        UPDATE_CHECKER.start()
 
     if not no_browser:
+        import webbrowser
         webbrowser.open(url)
 
-    server.serve_forever()
+    # Let SIGTERM unwind normally so the checksum cache is written
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    finally:
+        CHECKSUM_CACHE.flush()
 
 
 if __name__ == "__main__":